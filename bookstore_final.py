@@ -1,12 +1,23 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 import mysql.connector as mysqlcon
+from mysql.connector import pooling
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import groupby, islice
+from operator import itemgetter
+import os
 import re
+import threading
+import time
 import logging
 import hashlib
-from decimal import Decimal
-from typing import Optional, List, Tuple, Dict, Any
+import hmac
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, InvalidHashError
+from decimal import Decimal, InvalidOperation
+from typing import Optional, List, Tuple, Dict, Any, Iterator
 
 # Configure logging
 logging.basicConfig(
@@ -15,101 +26,329 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-def hash_password(password: str) -> str:
-    """Generate SHA256 hash of a password"""
+# Bump when triggers, indexes or the DailySales definition change so existing databases rebuild them
+SCHEMA_VERSION = 1
+
+# Sized per the (cores * 2) + 1 rule, kept within 10-25 connections
+_POOL_SIZE = max(10, min((os.cpu_count() or 4) * 2 + 1, 25))
+# Tk-side worker threads. Each holds one buffered query result or one 64 MiB Argon2 hash at a
+# time; reads that grow with the catalogue (the inventory report) stream through stream_query
+_BACKGROUND_WORKERS = 4
+# Rows inserted into a list view per scroll-to-bottom
+_TREE_PAGE_SIZE = 200
+
+# Book form fields that must be non-empty text
+_BOOK_TEXT_FIELDS = ("Book Name", "Genre", "Author", "Publisher")
+
+# Precompiled validation patterns
+# Names start with a letter and may contain spaces, apostrophes, periods and hyphens
+_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z '.-]{1,49}$")
+_PHONE_RE = re.compile(r'^\+?\d{10,15}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Argon2id hasher shared by all password operations
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+# Every hash in flight allocates memory_cost KiB (64 MiB), so peak hashing memory is
+# _HASH_WORKERS * 64 MiB (256 MiB) no matter how many cores the machine has
+_HASH_WORKERS = min(os.cpu_count() or 1, 4)
+
+def _legacy_sha256(password: str) -> str:
+    """Unsalted SHA256 digest used by accounts created before the Argon2 migration"""
+    # hashlib.sha256 is the OpenSSL EVP constructor, which uses SHA-NI when the CPU has it
     return hashlib.sha256(password.encode()).hexdigest()
 
+def _is_legacy_hash(stored_hash: str) -> bool:
+    return not stored_hash.startswith('$argon2')
+
+def hash_password(password: str) -> str:
+    """Generate a salted Argon2id hash of a password"""
+    return _password_hasher.hash(password)
+
+def hash_passwords_batch(passwords: List[str]) -> List[str]:
+    """Hash many passwords in parallel, e.g. for a bulk staff import"""
+    # argon2-cffi releases the GIL while hashing, so threads run on separate cores
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+        return list(executor.map(hash_password, passwords))
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    """Check a password against a stored Argon2id or legacy SHA256 hash"""
+    if _is_legacy_hash(stored_hash):
+        return hmac.compare_digest(stored_hash, _legacy_sha256(password))
+    try:
+        return _password_hasher.verify(stored_hash, password)
+    except (VerifyMismatchError, InvalidHashError):
+        return False
+
+def password_needs_rehash(stored_hash: str) -> bool:
+    """Return True if the stored hash is legacy or uses outdated Argon2 parameters"""
+    return _is_legacy_hash(stored_hash) or _password_hasher.check_needs_rehash(stored_hash)
+
+# Statement text lives here once, so every call sends the same string to the driver
+SQL_SELECT_LOGIN = "SELECT StaffID, Name, Role, PasswordHash FROM Staff WHERE Email = %s"
+SQL_UPDATE_PASSWORD_HASH = "UPDATE Staff SET PasswordHash=%s WHERE StaffID=%s"
+
+SQL_SELECT_BOOKS_MIN = "SELECT BookID, BookName FROM Books ORDER BY BookID"
+SQL_SELECT_BOOKS_PAGE = (
+    "SELECT BookID, BookName, Genre, Quantity, Author, Publisher, Price, LastUpdated FROM Books "
+    "ORDER BY BookID LIMIT %s OFFSET %s"
+)
+SQL_SELECT_BOOKS_IN_STOCK = "SELECT BookID, BookName, Price, Quantity FROM Books WHERE Quantity > 0"
+SQL_SELECT_BOOK = "SELECT BookName, Genre, Quantity, Author, Publisher, Price FROM Books WHERE BookID=%s"
+SQL_INSERT_BOOK = (
+    "INSERT INTO Books (BookName, Genre, Quantity, Author, Publisher, Price, Update_by) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+SQL_UPDATE_BOOK = (
+    "UPDATE Books SET BookName=%s, Genre=%s, Quantity=%s, Author=%s, Publisher=%s, Price=%s, Update_by=%s "
+    "WHERE BookID=%s"
+)
+SQL_DELETE_BOOK = "DELETE FROM Books WHERE BookID = %s"
+# Status and distinct book count of a stored order, locking the order and its items
+SQL_LOCK_ORDER = (
+    "SELECT o.Status, COUNT(DISTINCT oi.BookID) "
+    "FROM Orders o LEFT JOIN OrderItems oi ON oi.OrderID = o.OrderID "
+    "WHERE o.OrderID = %s GROUP BY o.OrderID FOR UPDATE"
+)
+# Takes stock for a whole stored order, joined server-side; rowcount is the number of books taken
+SQL_TAKE_ORDER_STOCK = (
+    "UPDATE Books b JOIN ("
+    "SELECT BookID, SUM(Quantity) AS Qty FROM OrderItems WHERE OrderID = %s GROUP BY BookID"
+    ") oi ON b.BookID = oi.BookID "
+    "SET b.Quantity = b.Quantity - oi.Qty "
+    "WHERE b.Quantity >= oi.Qty"
+)
+
+SQL_SELECT_CUSTOMERS = "SELECT CustomerID, CustomerName, Phone, Email, Membership FROM Accounts"
+SQL_SELECT_CUSTOMERS_MIN = "SELECT CustomerID, CustomerName FROM Accounts"
+SQL_SELECT_CUSTOMER = "SELECT CustomerName, Phone, Email, Membership FROM Accounts WHERE CustomerID=%s"
+SQL_INSERT_CUSTOMER = (
+    "INSERT INTO Accounts (CustomerName, Phone, Email, Membership) "
+    "VALUES (%s, %s, %s, %s)"
+)
+SQL_UPDATE_CUSTOMER = (
+    "UPDATE Accounts SET CustomerName=%s, Phone=%s, Email=%s, Membership=%s "
+    "WHERE CustomerID=%s"
+)
+# Refuses to delete customers that have orders; rowcount 0 means nothing was deleted
+SQL_DELETE_CUSTOMER = (
+    "DELETE FROM Accounts WHERE CustomerID = %s "
+    "AND NOT EXISTS (SELECT 1 FROM Orders WHERE CustomerID = %s)"
+)
+
+SQL_SELECT_STAFF = "SELECT StaffID, Name, Role, Phone, Email FROM Staff"
+SQL_STAFF_EXISTS = "SELECT 1 FROM Staff WHERE StaffID = %s"
+SQL_MANAGER_EXISTS = "SELECT StaffID FROM Staff WHERE Role='Manager' LIMIT 1"
+SQL_INSERT_STAFF = (
+    "INSERT INTO Staff (Name, Role, Phone, Email, PasswordHash) "
+    "VALUES (%s, %s, %s, %s, %s)"
+)
+SQL_UPDATE_STAFF = (
+    "UPDATE Staff SET Name=%s, Role=%s, Phone=%s, Email=%s "
+    "WHERE StaffID=%s"
+)
+SQL_UPDATE_STAFF_WITH_PASSWORD = (
+    "UPDATE Staff SET Name=%s, Role=%s, Phone=%s, Email=%s, PasswordHash=%s "
+    "WHERE StaffID=%s"
+)
+# Locks every manager row as well as the staff member's own, so two deletes cannot each
+# see the other manager and remove both
+SQL_LOCK_STAFF_ROLE = "SELECT StaffID, Role FROM Staff WHERE Role='Manager' OR StaffID=%s FOR UPDATE"
+SQL_DELETE_STAFF = "DELETE FROM Staff WHERE StaffID = %s"
+
+# DATE_FORMAT patterns are bound as parameters, keeping literal '%' out of SQL the driver scans for placeholders
+SQL_DATETIME_FORMAT = "%Y-%m-%d %H:%i"
+SQL_DATE_FORMAT = "%Y-%m-%d"
+
+# Pending orders with their items, one row per item; dates and amounts come back display-ready.
+# Takes SQL_DATETIME_FORMAT.
+SQL_SELECT_PENDING_ORDERS = (
+    "SELECT o.OrderID, a.CustomerName, DATE_FORMAT(o.OrderDate, %s), "
+    "CONCAT('$', FORMAT(o.TotalAmount, 2)), o.Status, "
+    "oi.BookID, b.BookName, oi.Quantity, "
+    "CONCAT('$', FORMAT(oi.Price, 2)), CONCAT('$', FORMAT(oi.Quantity * oi.Price, 2)) "
+    "FROM Orders o JOIN Accounts a ON o.CustomerID = a.CustomerID "
+    "LEFT JOIN OrderItems oi ON oi.OrderID = o.OrderID "
+    "LEFT JOIN Books b ON b.BookID = oi.BookID "
+    "WHERE o.Status = 'Pending' "
+    "ORDER BY o.OrderDate DESC, o.OrderID"
+)
+# History rows are display-ready, with the raw OrderDate last for the keyset.
+# Takes SQL_DATETIME_FORMAT, then the page size.
+SQL_SELECT_ORDER_HISTORY = (
+    "SELECT o.OrderID, a.CustomerName, DATE_FORMAT(o.OrderDate, %s), "
+    "CONCAT('$', FORMAT(o.TotalAmount, 2)), o.Status, o.OrderDate "
+    "FROM Orders o JOIN Accounts a ON o.CustomerID = a.CustomerID "
+    "ORDER BY o.OrderDate DESC, o.OrderID DESC LIMIT %s"
+)
+# Next history page after a (OrderDate, OrderID) keyset
+SQL_SELECT_ORDER_HISTORY_AFTER = (
+    "SELECT o.OrderID, a.CustomerName, DATE_FORMAT(o.OrderDate, %s), "
+    "CONCAT('$', FORMAT(o.TotalAmount, 2)), o.Status, o.OrderDate "
+    "FROM Orders o JOIN Accounts a ON o.CustomerID = a.CustomerID "
+    "WHERE o.OrderDate < %s OR (o.OrderDate = %s AND o.OrderID < %s) "
+    "ORDER BY o.OrderDate DESC, o.OrderID DESC LIMIT %s"
+)
+SQL_INSERT_ORDER = (
+    "INSERT INTO Orders (CustomerID, StaffID, OrderDate, TotalAmount, Status) "
+    "VALUES (%s, %s, %s, %s, %s)"
+)
+SQL_INSERT_ORDER_ITEM = (
+    "INSERT INTO OrderItems (OrderID, BookID, Quantity, Price) "
+    "VALUES (%s, %s, %s, %s)"
+)
+SQL_UPDATE_ORDER_STATUS = "UPDATE Orders SET Status=%s WHERE OrderID=%s"
+# One order's contribution to its day; takes the date, item count and amount
+SQL_BUMP_DAILY_SALES = (
+    "INSERT INTO DailySales (SaleDate, Orders, ItemsSold, TotalSales) VALUES (%s, 1, %s, %s) "
+    "ON DUPLICATE KEY UPDATE Orders = Orders + 1, "
+    "ItemsSold = ItemsSold + VALUES(ItemsSold), TotalSales = TotalSales + VALUES(TotalSales)"
+)
+
+# Daily rows from the DailySales summary; ROLLUP adds a NULL-date total row.
+# Takes SQL_DATE_FORMAT, then the date range.
+SQL_SELECT_SALES_REPORT = (
+    "SELECT DATE_FORMAT(SaleDate, %s), SUM(Orders), SUM(ItemsSold), "
+    "CONCAT('$', FORMAT(SUM(TotalSales), 2)) "
+    "FROM DailySales "
+    "WHERE SaleDate BETWEEN %s AND %s "
+    "GROUP BY SaleDate WITH ROLLUP"
+)
+SQL_SELECT_INVENTORY = (
+    "SELECT BookID, BookName, Genre, Quantity, CONCAT('$', FORMAT(Price, 2)) FROM Books "
+    "ORDER BY Genre, BookName"
+)
+
 class DatabaseManager:
     def __init__(self):
-        self.connection = None
+        self.pool = None
+        self._manager_exists = None
+        self._manager_cached_at = 0.0
         self.connect()
         self.initialize_database()
         
     def connect(self):
         try:
-            self.connection = mysqlcon.connect(
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name="eldorado",
+                pool_size=_POOL_SIZE,
+                # Resetting a returned connection also drops any server-side prepared statements,
+                # so a statement prepared per call is never reused; queries run on plain cursors
+                pool_reset_session=True,
                 host="localhost",
                 user="root",
                 password="password@123",
                 database="ElDorado",
-                autocommit=False
+                autocommit=False,
+                connection_timeout=5,
+                # Use the C extension for protocol handling and row parsing
+                use_pure=False
             )
-            logging.info("Database connection established")
+            logging.info(f"Database connection pool established (size {_POOL_SIZE})")
         except mysqlcon.Error as err:
             logging.error(f"Database connection failed: {err}")
             messagebox.showerror("Database Error", f"Failed to connect to database: {err}")
             raise
 
     def initialize_database(self):
+        connection = self.pool.get_connection()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Staff(
-                StaffID INT AUTO_INCREMENT PRIMARY KEY,
-                Name VARCHAR(100) NOT NULL,
-                Role ENUM('Manager', 'Clerk', 'Librarian') NOT NULL,
-                Email VARCHAR(100) NOT NULL UNIQUE,
-                Phone VARCHAR(15) NOT NULL UNIQUE,
-                HireDate DATE DEFAULT (CURRENT_DATE),
-                PasswordHash VARCHAR(255) NOT NULL
-            )""")
-            
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Books(
-                BookID INT AUTO_INCREMENT PRIMARY KEY,
-                BookName VARCHAR(500) NOT NULL,
-                Genre VARCHAR(250) NOT NULL,
-                Quantity INT NOT NULL CHECK (Quantity >= 0),
-                Author VARCHAR(250) NOT NULL,
-                Publisher VARCHAR(500) NOT NULL,
-                Price DECIMAL(10,2) NOT NULL CHECK (Price >= 0),
-                Update_by INT NOT NULL,
-                LastUpdated TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                FOREIGN KEY (Update_by) REFERENCES Staff(StaffID)
-            )""")
-            
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Accounts(
-                CustomerID INT AUTO_INCREMENT PRIMARY KEY,
-                CustomerName VARCHAR(50) NOT NULL,
-                Phone VARCHAR(15) NOT NULL UNIQUE,
-                Email VARCHAR(100) UNIQUE,
-                Membership ENUM('Yes', 'No') DEFAULT 'No'
-            )""")
-
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Orders(
-                OrderID INT AUTO_INCREMENT PRIMARY KEY,
-                CustomerID INT NOT NULL,
-                StaffID INT NOT NULL,
-                OrderDate DATETIME NOT NULL,
-                TotalAmount DECIMAL(10,2) NOT NULL,
-                Status ENUM('Pending', 'Completed', 'Cancelled') DEFAULT 'Pending',
-                FOREIGN KEY (CustomerID) REFERENCES Accounts(CustomerID),
-                FOREIGN KEY (StaffID) REFERENCES Staff(StaffID)
-            )""")
-
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS OrderItems(
-                OrderItemID INT AUTO_INCREMENT PRIMARY KEY,
-                OrderID INT NOT NULL,
-                BookID INT NOT NULL,
-                Quantity INT NOT NULL,
-                Price DECIMAL(10,2) NOT NULL,
-                FOREIGN KEY (OrderID) REFERENCES Orders(OrderID),
-                FOREIGN KEY (BookID) REFERENCES Books(BookID)
-            )""")
-
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS BookLog (
-                LogID INT AUTO_INCREMENT PRIMARY KEY,
-                BookID INT NOT NULL,
-                Action ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
-                ActionTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                ActionBy INT NOT NULL,
-                FOREIGN KEY (BookID) REFERENCES Books(BookID) ON DELETE CASCADE,
-                FOREIGN KEY (ActionBy) REFERENCES Staff(StaffID)
-            )""")
+            cursor = connection.cursor()
+
+            # One metadata lookup decides which DDL is needed on this start
+            cursor.execute(
+                "SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE()"
+            )
+            existing_tables = {row[0] for row in cursor.fetchall()}
+
+            # Ordered so that foreign key targets are created first
+            tables = {
+                "Staff": """
+                CREATE TABLE IF NOT EXISTS Staff(
+                    StaffID INT AUTO_INCREMENT PRIMARY KEY,
+                    Name VARCHAR(100) NOT NULL,
+                    Role ENUM('Manager', 'Clerk', 'Librarian') NOT NULL,
+                    Email VARCHAR(100) NOT NULL UNIQUE,
+                    Phone VARCHAR(15) NOT NULL UNIQUE,
+                    HireDate DATE DEFAULT (CURRENT_DATE),
+                    PasswordHash VARCHAR(255) NOT NULL
+                )""",
+                "Books": """
+                CREATE TABLE IF NOT EXISTS Books(
+                    BookID INT AUTO_INCREMENT PRIMARY KEY,
+                    BookName VARCHAR(500) NOT NULL,
+                    Genre VARCHAR(250) NOT NULL,
+                    Quantity INT NOT NULL CHECK (Quantity >= 0),
+                    Author VARCHAR(250) NOT NULL,
+                    Publisher VARCHAR(500) NOT NULL,
+                    Price DECIMAL(10,2) NOT NULL CHECK (Price >= 0),
+                    Update_by INT NOT NULL,
+                    LastUpdated TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    FOREIGN KEY (Update_by) REFERENCES Staff(StaffID)
+                )""",
+                "Accounts": """
+                CREATE TABLE IF NOT EXISTS Accounts(
+                    CustomerID INT AUTO_INCREMENT PRIMARY KEY,
+                    CustomerName VARCHAR(50) NOT NULL,
+                    Phone VARCHAR(15) NOT NULL UNIQUE,
+                    Email VARCHAR(100) UNIQUE,
+                    Membership ENUM('Yes', 'No') DEFAULT 'No'
+                )""",
+                "Orders": """
+                CREATE TABLE IF NOT EXISTS Orders(
+                    OrderID INT AUTO_INCREMENT PRIMARY KEY,
+                    CustomerID INT NOT NULL,
+                    StaffID INT NOT NULL,
+                    OrderDate DATETIME NOT NULL,
+                    TotalAmount DECIMAL(10,2) NOT NULL,
+                    Status ENUM('Pending', 'Completed', 'Cancelled') DEFAULT 'Pending',
+                    FOREIGN KEY (CustomerID) REFERENCES Accounts(CustomerID),
+                    FOREIGN KEY (StaffID) REFERENCES Staff(StaffID)
+                )""",
+                "OrderItems": """
+                CREATE TABLE IF NOT EXISTS OrderItems(
+                    OrderItemID INT AUTO_INCREMENT PRIMARY KEY,
+                    OrderID INT NOT NULL,
+                    BookID INT NOT NULL,
+                    Quantity INT NOT NULL,
+                    Price DECIMAL(10,2) NOT NULL,
+                    FOREIGN KEY (OrderID) REFERENCES Orders(OrderID),
+                    FOREIGN KEY (BookID) REFERENCES Books(BookID)
+                )""",
+                "BookLog": """
+                CREATE TABLE IF NOT EXISTS BookLog (
+                    LogID INT AUTO_INCREMENT PRIMARY KEY,
+                    BookID INT NOT NULL,
+                    Action ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
+                    ActionTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    ActionBy INT NOT NULL,
+                    FOREIGN KEY (BookID) REFERENCES Books(BookID) ON DELETE CASCADE,
+                    FOREIGN KEY (ActionBy) REFERENCES Staff(StaffID)
+                )""",
+                # Per-day sales totals; every order counts, items or not. place_order is the only
+                # supported writer of Orders and OrderItems: it bumps this table in the same
+                # transaction. Rows written any other way drift until a schema version bump rebuilds it.
+                "DailySales": """
+                CREATE TABLE IF NOT EXISTS DailySales(
+                    SaleDate DATE PRIMARY KEY,
+                    Orders INT NOT NULL DEFAULT 0,
+                    ItemsSold INT NOT NULL DEFAULT 0,
+                    TotalSales DECIMAL(12,2) NOT NULL DEFAULT 0
+                )""",
+                "SchemaMeta": """
+                CREATE TABLE IF NOT EXISTS SchemaMeta(
+                    ID TINYINT PRIMARY KEY,
+                    Version INT NOT NULL
+                )""",
+            }
+
+            for name, sql in tables.items():
+                if name not in existing_tables:
+                    cursor.execute(sql)
+                    logging.info(f"Table {name} created")
+
+            cursor.execute("SELECT Version FROM SchemaMeta WHERE ID = 1")
+            row = cursor.fetchone()
+            schema_stale = row is None or row[0] < SCHEMA_VERSION
 
             triggers = {
                 "AfterBookInsert": """
@@ -136,13 +375,59 @@ class DatabaseManager:
                 VALUES (OLD.BookID, 'DELETE', manager_id);
                 END IF;
                 END
-                """
+                """,
             }
 
+            cursor.execute(
+                "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = DATABASE()"
+            )
+            existing_triggers = {row[0] for row in cursor.fetchall()}
+
+            # Triggers are only rebuilt when missing or when the schema version changes
             for name, sql in triggers.items():
-                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
-                cursor.execute(sql)
-                logging.info(f"Trigger {name} created")
+                if schema_stale or name not in existing_triggers:
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+                    cursor.execute(sql)
+                    logging.info(f"Trigger {name} created")
+
+            if schema_stale or "DailySales" not in existing_tables:
+                # Rebuild the summary from the orders themselves, so it matches place_order's bumps
+                cursor.execute("DELETE FROM DailySales")
+                cursor.execute(
+                    "INSERT INTO DailySales (SaleDate, Orders, ItemsSold, TotalSales) "
+                    "SELECT DATE(o.OrderDate), COUNT(*), COALESCE(SUM(oi.Qty), 0), COALESCE(SUM(oi.Amount), 0) "
+                    "FROM Orders o LEFT JOIN ("
+                    "SELECT OrderID, SUM(Quantity) AS Qty, SUM(Quantity * Price) AS Amount "
+                    "FROM OrderItems GROUP BY OrderID"
+                    ") oi ON o.OrderID = oi.OrderID "
+                    "GROUP BY DATE(o.OrderDate)"
+                )
+
+            # Secondary indexes for hot lookups; MySQL has no CREATE INDEX IF NOT EXISTS
+            indexes = {
+                "idx_staff_role": ("Staff", "Role"),
+                "idx_books_name": ("Books", "BookName"),
+                "idx_accounts_name": ("Accounts", "CustomerName"),
+                # Pending orders by date
+                "idx_orders_status_date": ("Orders", "Status, OrderDate"),
+                # History pages; InnoDB appends OrderID to the index, so each keyset page is an
+                # index range read instead of a sort of every order. The sales report reads DailySales.
+                "idx_orders_date": ("Orders", "OrderDate"),
+            }
+
+            if schema_stale:
+                for name, (table, columns) in indexes.items():
+                    cursor.execute(f"SHOW INDEX FROM {table} WHERE Key_name = %s", (name,))
+                    if not cursor.fetchall():
+                        cursor.execute(f"CREATE INDEX {name} ON {table}({columns})")
+                        logging.info(f"Index {name} created")
+
+                cursor.execute(
+                    "INSERT INTO SchemaMeta (ID, Version) VALUES (1, %s) "
+                    "ON DUPLICATE KEY UPDATE Version = VALUES(Version)",
+                    (SCHEMA_VERSION,)
+                )
+                logging.info(f"Schema version set to {SCHEMA_VERSION}")
 
             # Add default admin if not exists
             cursor.execute("SELECT COUNT(*) FROM Staff WHERE Role='Manager'")
@@ -154,56 +439,154 @@ class DatabaseManager:
                 )
                 logging.info("Default admin account created")
 
-            self.connection.commit()
+            connection.commit()
             cursor.close()
 
         except mysqlcon.Error as err:
-            self.connection.rollback()
+            connection.rollback()
             logging.error(f"Database initialization failed: {err}")
             messagebox.showerror("Database Error", f"Failed to initialize database: {err}")
             raise
+        finally:
+            connection.close()
             
     def execute_query(self, query: str, params: Tuple = None, fetch: bool = False) -> Optional[List[Tuple]]:
+        connection = self.pool.get_connection()
         try:
-            cursor = self.connection.cursor()
+            cursor = connection.cursor()
             cursor.execute(query, params or ())
             if fetch:
                 result = cursor.fetchall()
                 cursor.close()
                 return result
             else:
-                self.connection.commit()
+                connection.commit()
                 cursor.close()
         except mysqlcon.Error as err:
-            self.connection.rollback()
+            connection.rollback()
             logging.error(f"Query failed: {query} - Error: {err}")
-            messagebox.showerror("Database Error", f"Operation failed: {err}")
+            # Tk is not thread-safe; background callers report errors on the main thread
+            if threading.current_thread() is threading.main_thread():
+                messagebox.showerror("Database Error", f"Operation failed: {err}")
             raise
+        finally:
+            # Returns the connection to the pool
+            connection.close()
+
+    def fetch_batch(self, statements: List[Tuple[str, Tuple]]) -> List[List[Tuple]]:
+        """Run several (query, params) reads on one pooled connection and cursor"""
+        connection = self.pool.get_connection()
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            results = []
+            for query, params in statements:
+                cursor.execute(query, params)
+                results.append(cursor.fetchall())
+            return results
+        except mysqlcon.Error as err:
+            logging.error(f"Batch query failed: {err}")
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+            connection.close()
+
+    def stream_query(self, query: str, params: Tuple = None,
+                     batch_size: int = _TREE_PAGE_SIZE) -> Iterator[List[Tuple]]:
+        """Yield query's rows in batches from an unbuffered cursor, holding one pooled connection"""
+        connection = self.pool.get_connection()
+        cursor = None
+        try:
+            # Unbuffered: rows stay on the server until fetched, so memory is bounded by batch_size
+            cursor = connection.cursor(buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        except mysqlcon.Error as err:
+            logging.error(f"Streamed query failed: {query} - Error: {err}")
+            raise
+        finally:
+            if cursor is not None:
+                # An abandoned stream must drain before the cursor can close
+                connection.consume_results()
+                cursor.close()
+            connection.close()
+
+    @contextmanager
+    def transaction(self):
+        """Yield a cursor on a pooled connection; commit on success, roll back on error"""
+        connection = self.pool.get_connection()
+        cursor = None
+        try:
+            connection.start_transaction()
+            # One cursor serves every statement in the transaction. It is not kept on the app:
+            # a long-lived cursor would pin its pooled connection for the whole session.
+            cursor = connection.cursor()
+            yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+            connection.close()
+
+    def manager_exists(self, ttl: float = 30) -> bool:
+        """Return whether any Manager exists, cached for ttl seconds"""
+        if self._manager_exists is None or time.monotonic() - self._manager_cached_at > ttl:
+            rows = self.execute_query(SQL_MANAGER_EXISTS, fetch=True)
+            self._manager_exists = bool(rows)
+            self._manager_cached_at = time.monotonic()
+        return self._manager_exists
+
+    def invalidate_manager_cache(self):
+        self._manager_exists = None
 
     def close(self):
-        if self.connection:
-            self.connection.close()
-            logging.info("Database connection closed")
+        if self.pool:
+            self.pool._remove_connections()
+            logging.info("Database connection pool closed")
 
 class Validators:
+    # Inputs are expected to be stripped by the caller
     @staticmethod
     def validate_name(name: str) -> bool:
-        return bool(re.fullmatch(r'^[A-Za-z\s]{2,50}$', name.strip()))
+        return _NAME_RE.fullmatch(name) is not None
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
-        return bool(re.fullmatch(r'^\+?\d{10,15}$', phone.strip()))
+        return _PHONE_RE.fullmatch(phone) is not None
     
     @staticmethod
     def validate_email(email: str) -> bool:
-        return bool(re.fullmatch(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email.strip()))
+        return _EMAIL_RE.fullmatch(email) is not None
     
+    @staticmethod
+    def contact_error(name: str, phone: str, email: str, *required: str) -> Optional[str]:
+        """Return the first problem with a contact form, or None if it is valid"""
+        if not all((name, phone, email, *required)):
+            return "Please fill all required fields"
+        if not Validators.validate_name(name):
+            return "Invalid name"
+        if not Validators.validate_phone(phone):
+            return "Invalid phone number"
+        if not Validators.validate_email(email):
+            return "Invalid email"
+        return None
+
     @staticmethod
     def validate_price(price: str) -> bool:
         try:
-            return float(price) >= 0
-        except ValueError:
+            value = Decimal(price)
+        except InvalidOperation:
             return False
+        # Decimal accepts 'Infinity' and 'NaN', which a DECIMAL column cannot hold
+        return value.is_finite() and value >= 0
     
     @staticmethod
     def validate_quantity(quantity: str) -> bool:
@@ -216,6 +599,15 @@ class BookstoreApp:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.db = DatabaseManager()
+        self.executor = ThreadPoolExecutor(max_workers=_BACKGROUND_WORKERS)
+        # Small lookup lists shared between windows, dropped by the mutators
+        self._cache: Dict[str, List[Tuple]] = {}
+        # Rows not yet inserted into lazily filled trees, keyed by widget path
+        self._lazy_rows: Dict[str, Any] = {}
+        # Pending debounced refreshes: key -> Tk after() id
+        self._refresh_jobs: Dict[str, str] = {}
+        # Bumped whenever order history restarts from the first page; older pages are dropped
+        self._history_generation = 0
         self.current_staff = None
 
         self.root.title("ElDorado Bookstore Management System")
@@ -225,6 +617,141 @@ class BookstoreApp:
         self.setup_styles()
         self.show_login_screen()
 
+    def _cached(self, key: str, query: str) -> List[Tuple]:
+        """Return rows for query, only hitting the database after an invalidation"""
+        if key not in self._cache:
+            self._cache[key] = self.db.execute_query(query, fetch=True)
+        return self._cache[key]
+
+    def _invalidate(self, *keys: str):
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def run_in_background(self, func, *args, callback=None, errback=None, **kwargs):
+        """Run func on a worker thread and pass its result to callback on the Tk thread
+
+        errback, if given, runs on the Tk thread after a failure has been reported.
+        """
+        future = self.executor.submit(func, *args, **kwargs)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._deliver_result, f, callback, errback)
+        )
+
+    def _deliver_result(self, future, callback, errback=None):
+        try:
+            result = future.result()
+        except Exception as e:
+            logging.error(f"Background task failed: {e}")
+            messagebox.showerror("Error", f"Operation failed: {e}")
+            if errback:
+                errback()
+            return
+        if callback:
+            callback(result)
+
+    def _schedule_refresh(self, key: str, func, delay: int = 100):
+        """Run func delay ms from now, replacing any refresh already scheduled under key"""
+        job = self._refresh_jobs.pop(key, None)
+        if job is not None:
+            self.root.after_cancel(job)
+
+        def run():
+            del self._refresh_jobs[key]
+            func()
+        self._refresh_jobs[key] = self.root.after(delay, run)
+
+    def run_query_async(self, query: str, params: Tuple = None, callback=None, errback=None):
+        """Fetch rows on a worker thread and pass them to callback on the Tk thread"""
+        self.run_in_background(
+            self.db.execute_query, query, params, fetch=True, callback=callback, errback=errback
+        )
+
+    def stream_query_async(self, query: str, params: Tuple = None, on_rows=None):
+        """Stream rows on a worker thread, passing each batch to on_rows on the Tk thread"""
+        def pump():
+            for rows in self.db.stream_query(query, params):
+                self.root.after(0, on_rows, rows)
+        self.run_in_background(pump)
+
+    def _watch_tree_bottom(self, tree, scrollbar, on_bottom):
+        """Drive scrollbar from tree and call on_bottom once the last row is in view"""
+        def yscroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 1.0:
+                tree.after_idle(on_bottom)
+        tree.configure(yscrollcommand=yscroll)
+
+    def _fill_tree_lazily(self, tree, rows):
+        """Replace tree's rows, inserting one page now and the rest as it is scrolled"""
+        tree.delete(*tree.get_children())
+        self._lazy_rows[str(tree)] = iter(rows)
+        self._append_lazy_rows(tree)
+
+    @staticmethod
+    def _repopulate(tree, rows, clear: bool = True):
+        """Replace (or with clear=False, extend) tree's rows with already formatted value tuples"""
+        if clear:
+            tree.delete(*tree.get_children())
+        insert = tree.insert
+        for row in rows:
+            insert('', 'end', values=row)
+
+    def _drop_tree_row(self, tree, row_id):
+        """Remove the row whose first column is row_id, whether shown or still pending"""
+        for iid in tree.get_children():
+            if tree.item(iid, 'values')[0] == str(row_id):
+                tree.delete(iid)
+                return
+        pending = self._lazy_rows.get(str(tree))
+        if pending is not None:
+            self._lazy_rows[str(tree)] = (row for row in pending if row[0] != row_id)
+
+    def _append_lazy_rows(self, tree):
+        rows = self._lazy_rows.get(str(tree))
+        if rows is None or not tree.winfo_exists():
+            return
+        page = list(islice(rows, _TREE_PAGE_SIZE))
+        if not page:
+            del self._lazy_rows[str(tree)]
+        self._repopulate(tree, page, clear=False)
+
+    @staticmethod
+    def _build_form(parent, spec, start_row: int = 0) -> Dict[str, Any]:
+        """Grid a label and input per (label, key, options) row and return the inputs by key.
+
+        Options with 'values' build a readonly combobox and yield its StringVar
+        ('default' sets the initial value); otherwise an Entry is built, with
+        'show' passed through for masked fields.
+        """
+        Label, Entry, Combobox, StringVar = ttk.Label, ttk.Entry, ttk.Combobox, tk.StringVar
+        widgets = {}
+        for i, (label, key, opts) in enumerate(spec, start=start_row):
+            Label(parent, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
+            if 'values' in opts:
+                var = StringVar(value=opts.get('default', ''))
+                Combobox(parent, textvariable=var, values=opts['values'], state="readonly") \
+                    .grid(row=i, column=1, padx=10, pady=5, sticky='ew')
+                widgets[key] = var
+            else:
+                entry = Entry(parent, show=opts.get('show', ''))
+                entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
+                widgets[key] = entry
+        parent.grid_columnconfigure(1, weight=1)
+        return widgets
+
+    @staticmethod
+    def _form_clearer(widgets: Dict[str, Any], combo_value: str = ''):
+        """Return a function that empties a _build_form form and resets its comboboxes"""
+        # Split once here so clearing needs no per-widget type checks
+        entries = [w for w in widgets.values() if isinstance(w, tk.Entry)]
+        combo_vars = [w for w in widgets.values() if not isinstance(w, tk.Entry)]
+        def clear():
+            for entry in entries:
+                entry.delete(0, 'end')
+            for var in combo_vars:
+                var.set(combo_value)
+        return clear
+
     def setup_styles(self):
         style = ttk.Style()
         style.theme_use('clam')
@@ -289,15 +816,21 @@ class BookstoreApp:
             return
 
         try:
-            staff = self.db.execute_query(
-                "SELECT StaffID, Name, Role, PasswordHash FROM Staff WHERE Email = %s",
-                (email,),
-                fetch=True
-            )
-
-            hashed_input = hash_password(password)
+            staff = self.db.execute_query(SQL_SELECT_LOGIN, (email,), fetch=True)
+
+            if staff and verify_password(staff[0][3], password):
+                if password_needs_rehash(staff[0][3]):
+                    # The old hash still verifies, so a failed upgrade is retried at the next login
+                    # and must not stop this one; transaction() reports nothing to the user
+                    try:
+                        with self.db.transaction() as cursor:
+                            cursor.execute(
+                                SQL_UPDATE_PASSWORD_HASH, (hash_password(password), staff[0][0])
+                            )
+                        logging.info(f"Password hash upgraded for staff {staff[0][0]}")
+                    except Exception as e:
+                        logging.warning(f"Password hash upgrade failed for staff {staff[0][0]}: {e}")
 
-            if staff and staff[0][3] == hashed_input:
                 self.current_staff = {
                     'id': staff[0][0],
                     'name': staff[0][1],
@@ -384,14 +917,9 @@ class BookstoreApp:
         add_frame = ttk.Frame(notebook)
         notebook.add(add_frame, text="➕ Add Book")
 
-        fields = ["Book Name", "Genre", "Quantity", "Author", "Publisher", "Price"]
-        self.add_entries = {}
-        
-        for i, label in enumerate(fields):
-            ttk.Label(add_frame, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
-            entry = ttk.Entry(add_frame)
-            entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-            self.add_entries[label] = entry
+        fields = [(label, label, {}) for label in
+                  ("Book Name", "Genre", "Quantity", "Author", "Publisher", "Price")]
+        self.add_entries = self._build_form(add_frame, fields)
 
         ttk.Button(
             add_frame,
@@ -409,12 +937,7 @@ class BookstoreApp:
         self.update_book_combo.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
         self.update_book_combo.bind("<<ComboboxSelected>>", self.load_book_details_for_update)
 
-        self.update_entries = {}
-        for i, label in enumerate(fields, start=1):
-            ttk.Label(update_frame, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
-            entry = ttk.Entry(update_frame)
-            entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-            self.update_entries[label] = entry
+        self.update_entries = self._build_form(update_frame, fields, start_row=1)
 
         ttk.Button(
             update_frame,
@@ -442,6 +965,30 @@ class BookstoreApp:
         view_frame = ttk.Frame(notebook)
         notebook.add(view_frame, text="📖 View Books")
 
+        # Books are shown one page at a time
+        self.books_page = 0
+        self.books_page_size = 100
+        self._books_total = None
+        self._books_loading = False
+
+        nav_frame = ttk.Frame(view_frame)
+        nav_frame.pack(side='bottom', fill='x', pady=5)
+
+        ttk.Button(
+            nav_frame,
+            text="◀ Prev",
+            command=lambda: self.change_books_page(-1)
+        ).pack(side='left', padx=10)
+
+        ttk.Button(
+            nav_frame,
+            text="Next ▶",
+            command=lambda: self.change_books_page(1)
+        ).pack(side='right', padx=10)
+
+        self.books_page_var = tk.StringVar(value="Page 1")
+        ttk.Label(nav_frame, textvariable=self.books_page_var).pack()
+
         columns = ("ID", "Book Name", "Genre", "Quantity", "Author", "Publisher", "Price", "Last Updated")
         self.books_tree = ttk.Treeview(view_frame, columns=columns, show='headings')
         
@@ -454,17 +1001,29 @@ class BookstoreApp:
         self.books_tree.column("Publisher", width=150)
         
         scrollbar = ttk.Scrollbar(view_frame, orient='vertical', command=self.books_tree.yview)
-        self.books_tree.configure(yscrollcommand=scrollbar.set)
+        self._watch_tree_bottom(self.books_tree, scrollbar, self._on_books_bottom)
         
         self.books_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        self.populate_book_dropdowns()
+        self.refresh_books()
+
+    def refresh_books(self):
+        """Reload the book dropdowns, the book count and the current page in one pass"""
+        # One ID/name fetch feeds both comboboxes and the page count
+        self.run_query_async(SQL_SELECT_BOOKS_MIN, callback=self._on_books_refreshed)
+
+    def _on_books_refreshed(self, books):
+        if not self.books_tree.winfo_exists():
+            return
+        self.populate_book_dropdowns(books)
+        self._set_books_total(len(books))
         self.load_books()
 
-    def populate_book_dropdowns(self):
-        books = self.db.execute_query("SELECT BookID, BookName FROM Books", fetch=True)
-        options = [f"{b[0]} - {b[1]}" for b in books]
+    def populate_book_dropdowns(self, books):
+        # Map each display label back to its ID so selections never need re-parsing
+        self._book_id_by_display = {f"{b[0]} - {b[1]}": b[0] for b in books}
+        options = list(self._book_id_by_display)
         self.update_book_combo['values'] = options
         self.delete_book_combo['values'] = options
 
@@ -472,12 +1031,8 @@ class BookstoreApp:
         if not self.update_book_combo.get(): 
             return
             
-        book_id = self.update_book_combo.get().split(' - ')[0]
-        book = self.db.execute_query(
-            "SELECT BookName, Genre, Quantity, Author, Publisher, Price FROM Books WHERE BookID=%s", 
-            (book_id,), 
-            fetch=True
-        )
+        book_id = self._book_id_by_display[self.update_book_combo.get()]
+        book = self.db.execute_query(SQL_SELECT_BOOK, (book_id,), fetch=True)
         
         if book:
             values = book[0]
@@ -490,55 +1045,45 @@ class BookstoreApp:
         if not self.delete_book_combo.get(): 
             return
             
-        book_id = self.delete_book_combo.get().split(' - ')[0]
-        book_name = self.delete_book_combo.get().split(' - ')[1]
+        selection = self.delete_book_combo.get()
+        book_id = self._book_id_by_display[selection]
+        book_name = selection.split(' - ', 1)[1]
         
         if not messagebox.askyesno("Confirm", f"Delete book '{book_name}'?"):
             return
             
         try:
-            manager_exists = self.db.execute_query(
-                "SELECT StaffID FROM Staff WHERE Role='Manager' LIMIT 1",
-                fetch=True
-            )
-            if not manager_exists:
+            if not self.db.manager_exists():
                 messagebox.showerror("Error", "Cannot delete book — no manager exists for logging.")
                 return
             
-            self.db.execute_query("DELETE FROM Books WHERE BookID = %s", (book_id,))
+            self.db.execute_query(SQL_DELETE_BOOK, (book_id,))
             messagebox.showinfo("Success", "Book deleted successfully!")
-            self.load_books()
-            self.populate_book_dropdowns()
+            self._invalidate('books_in_stock')
+            self.refresh_books()
         except Exception as e:
             logging.error(f"Delete book failed: {e}")
             messagebox.showerror("Error", f"Failed to delete: {e}")
 
     def add_book(self):
         try:
-            # Get all field values
-            book_name = self.add_entries["Book Name"].get().strip()
-            genre = self.add_entries["Genre"].get().strip()
-            quantity = self.add_entries["Quantity"].get().strip()
-            author = self.add_entries["Author"].get().strip()
-            publisher = self.add_entries["Publisher"].get().strip()
-            price = self.add_entries["Price"].get().strip()
+            # Get all field values in one pass
+            vals = {label: entry.get().strip() for label, entry in self.add_entries.items()}
 
             # Validate inputs
-            if not all([book_name, genre, author, publisher]):
+            if not all(vals[label] for label in _BOOK_TEXT_FIELDS):
                 messagebox.showerror("Error", "Please fill all text fields")
                 return
                 
-            if not Validators.validate_quantity(quantity):
+            if not Validators.validate_quantity(vals["Quantity"]):
                 messagebox.showerror("Error", "Invalid quantity")
                 return
                 
-            if not Validators.validate_price(price):
+            if not Validators.validate_price(vals["Price"]):
                 messagebox.showerror("Error", "Invalid price")
                 return
             staff_check = self.db.execute_query(
-                "SELECT 1 FROM Staff WHERE StaffID = %s",
-                (self.current_staff['id'],),
-                fetch=True
+                SQL_STAFF_EXISTS, (self.current_staff['id'],), fetch=True
             )
             if not staff_check:
                 messagebox.showerror("Error", "Current staff ID is invalid or deleted")
@@ -546,9 +1091,9 @@ class BookstoreApp:
             
             # Insert into database
             self.db.execute_query(
-                "INSERT INTO Books (BookName, Genre, Quantity, Author, Publisher, Price, Update_by) "
-                "VALUES (%s, %s, %s, %s, %s, %s, %s)",
-                (book_name, genre, int(quantity), author, publisher, float(price), self.current_staff['id'])
+                SQL_INSERT_BOOK,
+                (vals["Book Name"], vals["Genre"], int(vals["Quantity"]), vals["Author"],
+                 vals["Publisher"], Decimal(vals["Price"]), self.current_staff['id'])
             )
             
             messagebox.showinfo("Success", "Book added successfully!")
@@ -557,8 +1102,8 @@ class BookstoreApp:
             for entry in self.add_entries.values():
                 entry.delete(0, 'end')
                 
-            self.load_books()
-            self.populate_book_dropdowns()
+            self._invalidate('books_in_stock')
+            self.refresh_books()
             
         except Exception as e:
             logging.error(f"Add book failed: {e}")
@@ -570,32 +1115,27 @@ class BookstoreApp:
                 messagebox.showerror("Error", "No book selected")
                 return
                 
-            # Get all field values
-            book_name = self.update_entries["Book Name"].get().strip()
-            genre = self.update_entries["Genre"].get().strip()
-            quantity = self.update_entries["Quantity"].get().strip()
-            author = self.update_entries["Author"].get().strip()
-            publisher = self.update_entries["Publisher"].get().strip()
-            price = self.update_entries["Price"].get().strip()
+            # Get all field values in one pass
+            vals = {label: entry.get().strip() for label, entry in self.update_entries.items()}
 
             # Validate inputs
-            if not all([book_name, genre, author, publisher]):
+            if not all(vals[label] for label in _BOOK_TEXT_FIELDS):
                 messagebox.showerror("Error", "Please fill all text fields")
                 return
                 
-            if not Validators.validate_quantity(quantity):
+            if not Validators.validate_quantity(vals["Quantity"]):
                 messagebox.showerror("Error", "Invalid quantity")
                 return
                 
-            if not Validators.validate_price(price):
+            if not Validators.validate_price(vals["Price"]):
                 messagebox.showerror("Error", "Invalid price")
                 return
 
             # Update database
             self.db.execute_query(
-                "UPDATE Books SET BookName=%s, Genre=%s, Quantity=%s, Author=%s, Publisher=%s, Price=%s, Update_by=%s "
-                "WHERE BookID=%s",
-                (book_name, genre, int(quantity), author, publisher, float(price), self.current_staff['id'], self.selected_update_book_id)
+                SQL_UPDATE_BOOK,
+                (vals["Book Name"], vals["Genre"], int(vals["Quantity"]), vals["Author"],
+                 vals["Publisher"], Decimal(vals["Price"]), self.current_staff['id'], self.selected_update_book_id)
             )
             
             messagebox.showinfo("Success", "Book updated successfully!")
@@ -604,24 +1144,63 @@ class BookstoreApp:
             for entry in self.update_entries.values():
                 entry.delete(0, 'end')
                 
-            self.load_books()
-            self.populate_book_dropdowns()
+            self._invalidate('books_in_stock')
+            self.refresh_books()
             
         except Exception as e:
             logging.error(f"Update book failed: {e}")
             messagebox.showerror("Error", f"Failed to update book: {e}")
 
     def load_books(self):
-        for item in self.books_tree.get_children():
-            self.books_tree.delete(item)
-            
-        books = self.db.execute_query(
-            "SELECT BookID, BookName, Genre, Quantity, Author, Publisher, Price, LastUpdated FROM Books",
-            fetch=True
+        self._books_loading = True
+        self.run_query_async(
+            SQL_SELECT_BOOKS_PAGE,
+            (self.books_page_size, self.books_page * self.books_page_size),
+            callback=self._populate_books_tree,
+            errback=self._on_books_load_failed
         )
-        
-        for book in books:
-            self.books_tree.insert('', 'end', values=book)
+
+    def _populate_books_tree(self, books):
+        self._books_loading = False
+        # The window may have been closed while the query was running
+        if not self.books_tree.winfo_exists():
+            return
+        self._repopulate(self.books_tree, books)
+        # A new page starts at its top, away from the bottom that loaded it
+        self.books_tree.yview_moveto(0)
+        self._update_books_page_label()
+
+    def _on_books_load_failed(self):
+        self._books_loading = False
+
+    def _set_books_total(self, total: int):
+        self._books_total = total
+        # Step back if deletions emptied the current page
+        last_page = max(0, (total - 1) // self.books_page_size)
+        self.books_page = min(self.books_page, last_page)
+
+    def _update_books_page_label(self):
+        if self._books_total is None:
+            self.books_page_var.set(f"Page {self.books_page + 1}")
+        else:
+            pages = max(1, -(-self._books_total // self.books_page_size))
+            self.books_page_var.set(f"Page {self.books_page + 1} of {pages}")
+
+    def change_books_page(self, step: int):
+        page = self.books_page + step
+        if page < 0:
+            return
+        if self._books_total is not None and page * self.books_page_size >= self._books_total:
+            return
+        self.books_page = page
+        self.load_books()
+
+    def _on_books_bottom(self):
+        # Scrolling down to the last row moves on to the next page. A page that fits without
+        # scrolling is never at a scrolled-to bottom, so pages do not advance on their own.
+        if self._books_loading or self.books_tree.yview()[0] <= 0:
+            return
+        self.change_books_page(1)
 
     def customer_management(self):
         window = tk.Toplevel(self.root)
@@ -635,28 +1214,18 @@ class BookstoreApp:
         add_frame = ttk.Frame(notebook)
         notebook.add(add_frame, text="➕ Add Customer")
 
-        fields = ["Customer Name", "Phone", "Email", "Membership"]
-        self.customer_add_entries = {}
-        
-        for i, label in enumerate(fields):
-            ttk.Label(add_frame, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
-            
-            if label == "Membership":
-                var = tk.StringVar(value="No")
-                cb = ttk.Combobox(add_frame, textvariable=var, values=["Yes", "No"], state="readonly")
-                cb.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                self.customer_add_entries[label] = var
-            else:
-                entry = ttk.Entry(add_frame)
-                entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                self.customer_add_entries[label] = entry
+        fields = [(label, label, {}) for label in ("Customer Name", "Phone", "Email")]
+        self.customer_add_entries = self._build_form(
+            add_frame, fields + [("Membership", "Membership", {'values': ["Yes", "No"], 'default': "No"})]
+        )
+        self._clear_customer_add = self._form_clearer(self.customer_add_entries, "No")
 
         ttk.Button(
             add_frame,
             text="Add Customer",
             command=self.add_customer,
             style='Accent.TButton'
-        ).grid(row=len(fields), column=0, columnspan=2, pady=10)
+        ).grid(row=len(self.customer_add_entries), column=0, columnspan=2, pady=10)
 
         # Tab 2: Update Customer
         update_frame = ttk.Frame(notebook)
@@ -667,26 +1236,17 @@ class BookstoreApp:
         self.update_customer_combo.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
         self.update_customer_combo.bind("<<ComboboxSelected>>", self.load_customer_details_for_update)
 
-        self.customer_update_entries = {}
-        for i, label in enumerate(fields, start=1):
-            ttk.Label(update_frame, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
-            
-            if label == "Membership":
-                var = tk.StringVar()
-                cb = ttk.Combobox(update_frame, textvariable=var, values=["Yes", "No"], state="readonly")
-                cb.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                self.customer_update_entries[label] = var
-            else:
-                entry = ttk.Entry(update_frame)
-                entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                self.customer_update_entries[label] = entry
+        self.customer_update_entries = self._build_form(
+            update_frame, fields + [("Membership", "Membership", {'values': ["Yes", "No"]})], start_row=1
+        )
+        self._clear_customer_update = self._form_clearer(self.customer_update_entries, "No")
 
         ttk.Button(
             update_frame,
             text="Update Customer",
             command=self.update_customer,
             style='Accent.TButton'
-        ).grid(row=len(fields)+1, column=0, columnspan=2, pady=10)
+        ).grid(row=len(self.customer_update_entries)+1, column=0, columnspan=2, pady=10)
 
         # Tab 3: Delete Customer
         delete_frame = ttk.Frame(notebook)
@@ -718,17 +1278,18 @@ class BookstoreApp:
         self.customers_tree.column("Email", width=200)
         
         scrollbar = ttk.Scrollbar(view_frame, orient='vertical', command=self.customers_tree.yview)
-        self.customers_tree.configure(yscrollcommand=scrollbar.set)
+        self._watch_tree_bottom(
+            self.customers_tree, scrollbar, lambda: self._append_lazy_rows(self.customers_tree)
+        )
         
         self.customers_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        self.populate_customer_dropdowns()
-        self.load_customers()
+        self.refresh_customers()
 
-    def populate_customer_dropdowns(self):
-        customers = self.db.execute_query("SELECT CustomerID, CustomerName FROM Accounts", fetch=True)
-        options = [f"{c[0]} - {c[1]}" for c in customers]
+    def populate_customer_dropdowns(self, customers):
+        self._customer_id_by_display = {f"{c[0]} - {c[1]}": c[0] for c in customers}
+        options = list(self._customer_id_by_display)
         self.update_customer_combo['values'] = options
         self.delete_customer_combo['values'] = options
 
@@ -736,12 +1297,8 @@ class BookstoreApp:
         if not self.update_customer_combo.get(): 
             return
             
-        customer_id = self.update_customer_combo.get().split(' - ')[0]
-        customer = self.db.execute_query(
-            "SELECT CustomerName, Phone, Email, Membership FROM Accounts WHERE CustomerID=%s", 
-            (customer_id,), 
-            fetch=True
-        )
+        customer_id = self._customer_id_by_display[self.update_customer_combo.get()]
+        customer = self.db.execute_query(SQL_SELECT_CUSTOMER, (customer_id,), fetch=True)
         
         if customer:
             name, phone, email, membership = customer[0]
@@ -758,75 +1315,71 @@ class BookstoreApp:
         if not self.delete_customer_combo.get(): 
             return
             
-        customer_id = self.delete_customer_combo.get().split(' - ')[0]
-        customer_name = self.delete_customer_combo.get().split(' - ')[1]
+        selection = self.delete_customer_combo.get()
+        customer_id = self._customer_id_by_display[selection]
+        customer_name = selection.split(' - ', 1)[1]
         
         if not messagebox.askyesno("Confirm", f"Delete customer '{customer_name}'?"):
             return
-            
-        try:
-            # Check if customer has any orders
-            orders = self.db.execute_query(
-                "SELECT COUNT(*) FROM Orders WHERE CustomerID=%s",
-                (customer_id,),
-                fetch=True
-            )
-            
-            if orders and orders[0][0] > 0:
-                messagebox.showerror("Error", "Cannot delete customer with existing orders")
-                return
-                
-            self.db.execute_query("DELETE FROM Accounts WHERE CustomerID = %s", (customer_id,))
-            messagebox.showinfo("Success", "Customer deleted successfully!")
-            self.load_customers()
-            self.populate_customer_dropdowns()
-        except Exception as e:
-            logging.error(f"Delete customer failed: {e}")
-            messagebox.showerror("Error", f"Failed to delete: {e}")
+
+        # Drop the customer from the window right away; the database catches up
+        self._drop_tree_row(self.customers_tree, customer_id)
+        del self._customer_id_by_display[selection]
+        options = list(self._customer_id_by_display)
+        self.update_customer_combo['values'] = options
+        self.delete_customer_combo['values'] = options
+        self.delete_customer_combo.set('')
+        if 'customers_min' in self._cache:
+            self._cache['customers_min'] = [c for c in self._cache['customers_min'] if c[0] != customer_id]
+
+        self.run_in_background(
+            self._delete_customer_row, customer_id,
+            callback=self._on_customer_deleted,
+            errback=self.refresh_customers
+        )
+
+    def _delete_customer_row(self, customer_id) -> str:
+        """Delete the customer unless they have orders; return 'deleted', 'missing' or 'has_orders'"""
+        with self.db.transaction() as cursor:
+            cursor.execute(SQL_DELETE_CUSTOMER, (customer_id, customer_id))
+            if cursor.rowcount == 1:
+                return 'deleted'
+            # No row matched: another session removed the customer, or they have orders
+            cursor.execute(SQL_SELECT_CUSTOMER, (customer_id,))
+            return 'has_orders' if cursor.fetchone() else 'missing'
+
+    def _on_customer_deleted(self, outcome: str):
+        if outcome == 'missing':
+            # Already gone, which is what the window shows
+            messagebox.showinfo("Info", "Customer had already been deleted")
+        elif outcome == 'has_orders':
+            messagebox.showerror("Error", "Cannot delete customer with existing orders")
+            # Put back what was removed optimistically
+            self._invalidate('customers_min')
+            self.refresh_customers()
 
     def add_customer(self):
         try:
             # Get all field values
-            name = self.customer_add_entries["Customer Name"].get().strip()
-            phone = self.customer_add_entries["Phone"].get().strip()
-            email = self.customer_add_entries["Email"].get().strip()
-            membership = self.customer_add_entries["Membership"].get()
+            entries = self.customer_add_entries
+            name, phone, email = (entries[k].get().strip() for k in ("Customer Name", "Phone", "Email"))
+            membership = entries["Membership"].get()
 
             # Validate inputs
-            if not all([name, phone, email]):
-                messagebox.showerror("Error", "Please fill all required fields")
-                return
-                
-            if not Validators.validate_name(name):
-                messagebox.showerror("Error", "Invalid name")
-                return
-                
-            if not Validators.validate_phone(phone):
-                messagebox.showerror("Error", "Invalid phone number")
-                return
-                
-            if not Validators.validate_email(email):
-                messagebox.showerror("Error", "Invalid email")
+            error = Validators.contact_error(name, phone, email)
+            if error:
+                messagebox.showerror("Error", error)
                 return
 
             # Insert into database
-            self.db.execute_query(
-                "INSERT INTO Accounts (CustomerName, Phone, Email, Membership) "
-                "VALUES (%s, %s, %s, %s)",
-                (name, phone, email, membership)
-            )
+            self.db.execute_query(SQL_INSERT_CUSTOMER, (name, phone, email, membership))
             
             messagebox.showinfo("Success", "Customer added successfully!")
             
             # Clear form and refresh data
-            for entry in self.customer_add_entries.values():
-                if isinstance(entry, tk.Entry):
-                    entry.delete(0, 'end')
-                else:
-                    entry.set("No")
-                
-            self.load_customers()
-            self.populate_customer_dropdowns()
+            self._clear_customer_add()
+            self._invalidate('customers_min')
+            self.refresh_customers()
             
         except mysqlcon.IntegrityError as e:
             if "Duplicate entry" in str(e):
@@ -845,46 +1398,28 @@ class BookstoreApp:
                 return
                 
             # Get all field values
-            name = self.customer_update_entries["Customer Name"].get().strip()
-            phone = self.customer_update_entries["Phone"].get().strip()
-            email = self.customer_update_entries["Email"].get().strip()
-            membership = self.customer_update_entries["Membership"].get()
+            entries = self.customer_update_entries
+            name, phone, email = (entries[k].get().strip() for k in ("Customer Name", "Phone", "Email"))
+            membership = entries["Membership"].get()
 
             # Validate inputs
-            if not all([name, phone, email]):
-                messagebox.showerror("Error", "Please fill all required fields")
-                return
-                
-            if not Validators.validate_name(name):
-                messagebox.showerror("Error", "Invalid name")
-                return
-                
-            if not Validators.validate_phone(phone):
-                messagebox.showerror("Error", "Invalid phone number")
-                return
-                
-            if not Validators.validate_email(email):
-                messagebox.showerror("Error", "Invalid email")
+            error = Validators.contact_error(name, phone, email)
+            if error:
+                messagebox.showerror("Error", error)
                 return
 
             # Update database
             self.db.execute_query(
-                "UPDATE Accounts SET CustomerName=%s, Phone=%s, Email=%s, Membership=%s "
-                "WHERE CustomerID=%s",
+                SQL_UPDATE_CUSTOMER,
                 (name, phone, email, membership, self.selected_update_customer_id)
             )
             
             messagebox.showinfo("Success", "Customer updated successfully!")
             
             # Clear form and refresh data
-            for entry in self.customer_update_entries.values():
-                if isinstance(entry, tk.Entry):
-                    entry.delete(0, 'end')
-                else:
-                    entry.set("No")
-                
-            self.load_customers()
-            self.populate_customer_dropdowns()
+            self._clear_customer_update()
+            self._invalidate('customers_min')
+            self.refresh_customers()
             
         except mysqlcon.IntegrityError as e:
             if "Duplicate entry" in str(e):
@@ -896,19 +1431,28 @@ class BookstoreApp:
             logging.error(f"Update customer failed: {e}")
             messagebox.showerror("Error", f"Failed to update customer: {e}")
 
-    def load_customers(self):
-        for item in self.customers_tree.get_children():
-            self.customers_tree.delete(item)
-            
-        customers = self.db.execute_query(
-            "SELECT CustomerID, CustomerName, Phone, Email, Membership FROM Accounts",
-            fetch=True
-        )
-        
-        for customer in customers:
-            self.customers_tree.insert('', 'end', values=customer)
+    def refresh_customers(self):
+        """Reload the customer list and the customer dropdowns from a single query"""
+        self.run_query_async(SQL_SELECT_CUSTOMERS, callback=self._on_customers_refreshed)
+
+    def _on_customers_refreshed(self, customers):
+        if not self.customers_tree.winfo_exists():
+            return
+        # Share the fresh ID/name list with the order window's customer combobox
+        self._cache['customers_min'] = [(c[0], c[1]) for c in customers]
+        self.populate_customer_dropdowns(customers)
+        self._fill_tree_lazily(self.customers_tree, customers)
+
     def staff_management(self):
-        window = tk.Toplevel(self.root)
+        # Bring back the open window rather than building a second copy of the form
+        window = getattr(self, '_staff_window', None)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            self.load_staff_list()
+            return
+
+        window = self._staff_window = tk.Toplevel(self.root)
         window.title("Staff Management")
         window.geometry("800x600")
 
@@ -930,7 +1474,9 @@ class BookstoreApp:
         self.staff_tree.column("Email", width=200)
         
         scrollbar = ttk.Scrollbar(view_frame, orient='vertical', command=self.staff_tree.yview)
-        self.staff_tree.configure(yscrollcommand=scrollbar.set)
+        self._watch_tree_bottom(
+            self.staff_tree, scrollbar, lambda: self._append_lazy_rows(self.staff_tree)
+        )
         
         self.staff_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
@@ -942,27 +1488,15 @@ class BookstoreApp:
             notebook.add(add_frame, text="➕ Add Staff")
 
             fields = [
-                ("Name", "staff_name"),
-                ("Role", "staff_role"),
-                ("Phone", "staff_phone"),
-                ("Email", "staff_email"),
-                ("Password", "staff_password")
+                ("Name", "staff_name", {}),
+                ("Role", "staff_role", {'values': ["Manager", "Clerk", "Librarian"]}),
+                ("Phone", "staff_phone", {}),
+                ("Email", "staff_email", {}),
+                ("Password", "staff_password", {'show': "*"})
             ]
 
-            for i, (label, var_name) in enumerate(fields):
-                ttk.Label(add_frame, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
-                
-                if label == "Role":
-                    var = tk.StringVar()
-                    cb = ttk.Combobox(add_frame, textvariable=var, values=["Manager", "Clerk", "Librarian"], state="readonly")
-                    cb.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                    setattr(self, var_name, var)
-                else:
-                    entry = ttk.Entry(add_frame)
-                    if label == "Password":
-                        entry.config(show="*")
-                    entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                    setattr(self, var_name, entry)
+            self.staff_add_entries = self._build_form(add_frame, fields)
+            self._clear_staff_add = self._form_clearer(self.staff_add_entries)
 
             ttk.Button(
                 add_frame,
@@ -980,21 +1514,8 @@ class BookstoreApp:
             self.staff_combo.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
             self.staff_combo.bind("<<ComboboxSelected>>", self.load_staff_details)
 
-            self.manage_entries = {}
-            for i, (label, var_name) in enumerate(fields, start=1):
-                ttk.Label(manage_frame, text=label).grid(row=i, column=0, padx=10, pady=5, sticky='e')
-                
-                if label == "Role":
-                    var = tk.StringVar()
-                    cb = ttk.Combobox(manage_frame, textvariable=var, values=["Manager", "Clerk", "Librarian"], state="readonly")
-                    cb.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                    self.manage_entries[var_name] = var
-                else:
-                    entry = ttk.Entry(manage_frame)
-                    if label == "Password":
-                        entry.config(show="*")
-                    entry.grid(row=i, column=1, padx=10, pady=5, sticky='ew')
-                    self.manage_entries[var_name] = entry
+            self.manage_entries = self._build_form(manage_frame, fields, start_row=1)
+            self._clear_staff_manage = self._form_clearer(self.manage_entries)
 
             button_frame = ttk.Frame(manage_frame)
             button_frame.grid(row=len(fields)+1, column=0, columnspan=2, pady=10)
@@ -1018,7 +1539,9 @@ class BookstoreApp:
         # Load staff list for all users
         self.load_staff_list()            
     def populate_staff_dropdowns(self):
-        staff = self.db.execute_query("SELECT StaffID, Name FROM Staff", fetch=True)
+        staff = self._cached('staff', SQL_SELECT_STAFF)
+        # Full rows by ID, so selecting a staff member needs no extra query
+        self._staff_by_id = {s[0]: s for s in staff}
         options = [f"{s[0]} - {s[1]}" for s in staff]
         self.staff_combo['values'] = options
 
@@ -1026,15 +1549,11 @@ class BookstoreApp:
         if not self.staff_combo.get(): 
             return
             
-        staff_id = self.staff_combo.get().split(' - ')[0]
-        staff = self.db.execute_query(
-            "SELECT Name, Role, Phone, Email FROM Staff WHERE StaffID=%s", 
-            (staff_id,), 
-            fetch=True
-        )
+        staff_id = int(self.staff_combo.get().split(' - ', 1)[0])
+        staff = self._staff_by_id.get(staff_id)
         
         if staff:
-            name, role, phone, email = staff[0]
+            _, name, role, phone, email = staff
             self.manage_entries["staff_name"].delete(0, 'end')
             self.manage_entries["staff_name"].insert(0, name)
             self.manage_entries["staff_role"].set(role)
@@ -1048,54 +1567,41 @@ class BookstoreApp:
     def add_staff(self):
         try:
             # Get all field values
-            name = self.staff_name.get().strip()
-            role = self.staff_role.get().strip()
-            phone = self.staff_phone.get().strip()
-            email = self.staff_email.get().strip()
-            password = self.staff_password.get().strip()
+            entries = self.staff_add_entries
+            name, role, phone, email, password = (
+                entries[k].get().strip()
+                for k in ("staff_name", "staff_role", "staff_phone", "staff_email", "staff_password")
+            )
 
             # Validate inputs
-            if not all([name, role, phone, email, password]):
-                messagebox.showerror("Error", "Please fill all fields")
-                return
-                
-            if not Validators.validate_name(name):
-                messagebox.showerror("Error", "Invalid name")
+            error = Validators.contact_error(name, phone, email, role, password)
+            if error:
+                messagebox.showerror("Error", error)
                 return
-                
-            if not Validators.validate_phone(phone):
-                messagebox.showerror("Error", "Invalid phone number")
-                return
-                
-            if not Validators.validate_email(email):
-                messagebox.showerror("Error", "Invalid email")
-                return
-
-            # Hash password
-            password_hash = hash_password(password)
 
-            # Insert into database
-            self.db.execute_query(
-                "INSERT INTO Staff (Name, Role, Phone, Email, PasswordHash) "
-                "VALUES (%s, %s, %s, %s, %s)",
-                (name, role, phone, email, password_hash))
-            
-            messagebox.showinfo("Success", "Staff member added successfully!")
-            
-            # Clear form and refresh data
-            self.staff_name.delete(0, 'end')
-            self.staff_role.set('')
-            self.staff_phone.delete(0, 'end')
-            self.staff_email.delete(0, 'end')
-            self.staff_password.delete(0, 'end')
-                
-            self.populate_staff_dropdowns()
-            self.load_staff_list()
+            # Hash off the Tk thread; Argon2 is deliberately slow
+            self.run_in_background(
+                hash_password, password,
+                callback=lambda password_hash: self._insert_staff(name, role, phone, email, password_hash)
+            )
             
         except Exception as e:
             logging.error(f"Add staff failed: {e}")
             messagebox.showerror("Error", f"Failed to add staff: {e}")
 
+    def _insert_staff(self, name: str, role: str, phone: str, email: str, password_hash: str):
+        try:
+            self.db.execute_query(SQL_INSERT_STAFF, (name, role, phone, email, password_hash))
+        except Exception as e:
+            logging.error(f"Add staff failed: {e}")
+            messagebox.showerror("Error", f"Failed to add staff: {e}")
+            return
+        
+        self.db.invalidate_manager_cache()
+        self._invalidate('staff')
+        messagebox.showinfo("Success", "Staff member added successfully!")
+        self._refresh_staff_window(self._clear_staff_add)
+
     def update_staff(self):
         try:
             if not hasattr(self, 'selected_staff_id'):
@@ -1103,59 +1609,65 @@ class BookstoreApp:
                 return
                 
             # Get all field values
-            name = self.manage_entries["staff_name"].get().strip()
-            role = self.manage_entries["staff_role"].get().strip()
-            phone = self.manage_entries["staff_phone"].get().strip()
-            email = self.manage_entries["staff_email"].get().strip()
-            password = self.manage_entries["staff_password"].get().strip()
+            entries = self.manage_entries
+            name, role, phone, email, password = (
+                entries[k].get().strip()
+                for k in ("staff_name", "staff_role", "staff_phone", "staff_email", "staff_password")
+            )
 
             # Validate inputs
-            if not all([name, role, phone, email]):
-                messagebox.showerror("Error", "Please fill all required fields")
-                return
-                
-            if not Validators.validate_name(name):
-                messagebox.showerror("Error", "Invalid name")
-                return
-                
-            if not Validators.validate_phone(phone):
-                messagebox.showerror("Error", "Invalid phone number")
-                return
-                
-            if not Validators.validate_email(email):
-                messagebox.showerror("Error", "Invalid email")
+            error = Validators.contact_error(name, phone, email, role)
+            if error:
+                messagebox.showerror("Error", error)
                 return
 
-            # Update database
+            staff_id = self.selected_staff_id
             if password:
-                password_hash = hash_password(password)
-                self.db.execute_query(
-                    "UPDATE Staff SET Name=%s, Role=%s, Phone=%s, Email=%s, PasswordHash=%s "
-                    "WHERE StaffID=%s",
-                    (name, role, phone, email, password_hash, self.selected_staff_id)
+                # Hash off the Tk thread; Argon2 is deliberately slow
+                self.run_in_background(
+                    hash_password, password,
+                    callback=lambda password_hash: self._save_staff_update(
+                        staff_id, name, role, phone, email, password_hash)
                 )
             else:
+                self._save_staff_update(staff_id, name, role, phone, email, None)
+            
+        except Exception as e:
+            logging.error(f"Update staff failed: {e}")
+            messagebox.showerror("Error", f"Failed to update staff: {e}")
+
+    def _save_staff_update(self, staff_id, name: str, role: str, phone: str, email: str,
+                           password_hash: Optional[str]):
+        try:
+            if password_hash:
                 self.db.execute_query(
-                    "UPDATE Staff SET Name=%s, Role=%s, Phone=%s, Email=%s "
-                    "WHERE StaffID=%s",
-                    (name, role, phone, email, self.selected_staff_id)
+                    SQL_UPDATE_STAFF_WITH_PASSWORD,
+                    (name, role, phone, email, password_hash, staff_id)
                 )
-            
-            messagebox.showinfo("Success", "Staff member updated successfully!")
-            
-            # Clear form and refresh data
-            for entry in self.manage_entries.values():
-                if isinstance(entry, tk.Entry):
-                    entry.delete(0, 'end')
-                else:
-                    entry.set('')
-                
-            self.populate_staff_dropdowns()
-            self.load_staff_list()
-            
+            else:
+                self.db.execute_query(SQL_UPDATE_STAFF, (name, role, phone, email, staff_id))
         except Exception as e:
             logging.error(f"Update staff failed: {e}")
             messagebox.showerror("Error", f"Failed to update staff: {e}")
+            return
+        
+        self.db.invalidate_manager_cache()
+        self._invalidate('staff')
+        messagebox.showinfo("Success", "Staff member updated successfully!")
+        self._refresh_staff_window(self._clear_staff_manage)
+
+    def _refresh_staff_window(self, clear_form):
+        """Clear a staff form and reload the lists, unless the window closed while hashing"""
+        if not self.staff_tree.winfo_exists():
+            return
+        try:
+            clear_form()
+            self.populate_staff_dropdowns()
+            self.load_staff_list()
+        except Exception as e:
+            # The change is already saved; only the display is out of date
+            logging.error(f"Staff window refresh failed: {e}")
+            messagebox.showerror("Error", f"Saved, but the staff list could not be refreshed: {e}")
 
     def delete_staff(self):
         try:
@@ -1169,57 +1681,66 @@ class BookstoreApp:
             if not messagebox.askyesno("Confirm", f"Delete staff member '{staff_name}'?"):
                 return
                 
-            # Don't allow deletion of the last manager
             if self.current_staff['id'] == int(staff_id):
                 messagebox.showerror("Error", "Cannot delete currently logged in staff")
                 return
-                
-            # Check if this is the last manager
-            staff = self.db.execute_query(
-                "SELECT Role FROM Staff WHERE StaffID=%s", 
-                (staff_id,), 
-                fetch=True
-            )
-            
-            if staff and staff[0][0] == 'Manager':
-                managers = self.db.execute_query(
-                    "SELECT COUNT(*) FROM Staff WHERE Role='Manager'", 
-                    fetch=True
-                )
-                if managers and managers[0][0] <= 1:
-                    messagebox.showerror("Error", "Cannot delete the last manager")
-                    return
 
-            # Delete from database
-            self.db.execute_query("DELETE FROM Staff WHERE StaffID = %s", (staff_id,))
-            
-            messagebox.showinfo("Success", "Staff member deleted successfully!")
-            
-            # Clear form and refresh data
-            for entry in self.manage_entries.values():
-                if isinstance(entry, tk.Entry):
-                    entry.delete(0, 'end')
-                else:
-                    entry.set('')
-                
-            self.populate_staff_dropdowns()
-            self.load_staff_list()
+            # Drop the staff member from the window right away; the database catches up
+            self._drop_tree_row(self.staff_tree, staff_id)
+            self._staff_by_id.pop(staff_id, None)
+            self.staff_combo['values'] = [f"{s[0]} - {s[1]}" for s in self._staff_by_id.values()]
+            self.staff_combo.set('')
+            self._cache['staff'] = list(self._staff_by_id.values())
+            del self.selected_staff_id
+            self._clear_staff_manage()
+
+            self.run_in_background(
+                self._delete_staff_row, staff_id,
+                callback=self._on_staff_deleted,
+                errback=self._reload_staff
+            )
             
         except Exception as e:
             logging.error(f"Delete staff failed: {e}")
             messagebox.showerror("Error", f"Failed to delete staff: {e}")
 
+    def _delete_staff_row(self, staff_id) -> str:
+        """Delete the staff member unless they are the last manager; return 'deleted', 'missing' or 'last_manager'"""
+        with self.db.transaction() as cursor:
+            cursor.execute(SQL_LOCK_STAFF_ROLE, (staff_id,))
+            roles = dict(cursor.fetchall())
+            role = roles.get(int(staff_id))
+            if role is None:
+                return 'missing'
+            if role == 'Manager' and len(roles) == 1:
+                return 'last_manager'
+            cursor.execute(SQL_DELETE_STAFF, (staff_id,))
+            return 'deleted'
+
+    def _on_staff_deleted(self, outcome: str):
+        self.db.invalidate_manager_cache()
+        if outcome == 'missing':
+            # Already gone, which is what the window shows
+            messagebox.showinfo("Info", "Staff member had already been deleted")
+        elif outcome == 'last_manager':
+            messagebox.showerror("Error", "Cannot delete the last manager")
+            # Put back what was removed optimistically
+            self._reload_staff()
+
+    def _reload_staff(self):
+        self._invalidate('staff')
+        if not self.staff_combo.winfo_exists():
+            return
+        self.populate_staff_dropdowns()
+        self.load_staff_list()
+
     def load_staff_list(self):
-        for item in self.staff_tree.get_children():
-            self.staff_tree.delete(item)
-            
-        staff = self.db.execute_query(
-            "SELECT StaffID, Name, Role, Phone, Email FROM Staff",
-            fetch=True
-        )
-        
-        for member in staff:
-            self.staff_tree.insert('', 'end', values=member)
+        self.run_query_async(SQL_SELECT_STAFF, callback=self._populate_staff_tree)
+
+    def _populate_staff_tree(self, staff):
+        if not self.staff_tree.winfo_exists():
+            return
+        self._fill_tree_lazily(self.staff_tree, staff)
 
     def order_management(self):
         window = tk.Toplevel(self.root)
@@ -1238,9 +1759,6 @@ class BookstoreApp:
         self.customer_combobox = ttk.Combobox(create_frame, state="readonly")
         self.customer_combobox.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
 
-        # Load customers into combobox
-        self.populate_customer_combobox()
-
         # Book selection and cart management
         ttk.Label(create_frame, text="Add to Cart:").grid(row=1, column=0, padx=10, pady=5, sticky='e')
 
@@ -1262,15 +1780,18 @@ class BookstoreApp:
             style='Accent.TButton'
         ).pack(side='left', padx=5)
 
-        # Load books into combobox
-        self.populate_book_combobox()
-
         # Cart display
         ttk.Label(create_frame, text="Cart Items:").grid(row=2, column=0, padx=10, pady=5, sticky='ne')
 
         cart_frame = ttk.Frame(create_frame)
         cart_frame.grid(row=2, column=1, padx=10, pady=5, sticky='nsew')
 
+        # Raw (book_id, quantity, unit price) per cart_tree row, which only holds the display text
+        self._cart: Dict[str, Tuple[int, int, Decimal]] = {}
+        # Running totals, adjusted as lines are added so nothing re-sums the cart
+        self._cart_count = 0
+        self._cart_total = Decimal("0")
+
         columns = ("Book ID", "Book Name", "Quantity", "Price", "Subtotal")
         self.cart_tree = ttk.Treeview(
             cart_frame,
@@ -1351,6 +1872,7 @@ class BookstoreApp:
         self.pending_orders_tree.configure(yscrollcommand=scrollbar.set)
 
         self.pending_orders_tree.pack(side='left', fill='both', expand=True)
+        self.pending_orders_tree.bind("<<TreeviewSelect>>", self.show_order_items)
         scrollbar.pack(side='right', fill='y')
 
         # Order items frame
@@ -1400,7 +1922,7 @@ class BookstoreApp:
         ttk.Button(
             action_frame,
             text="Refresh",
-            command=self.load_pending_orders
+            command=lambda: self._schedule_refresh('orders', self.reload_orders)
         ).pack(side='right', padx=5)
 
         # Tab 3: View All Orders
@@ -1424,32 +1946,60 @@ class BookstoreApp:
         self.orders_tree.column("Date", width=120)
 
         scrollbar = ttk.Scrollbar(view_frame, orient='vertical', command=self.orders_tree.yview)
-        self.orders_tree.configure(yscrollcommand=scrollbar.set)
+        self._watch_tree_bottom(self.orders_tree, scrollbar, self._load_more_order_history)
 
         self.orders_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        # Load initial data
-        self.load_pending_orders()
-        self.load_order_history()
+        # Load comboboxes and order lists
+        self._load_order_window_data()
 
         # Configure grid weights
         create_frame.grid_columnconfigure(1, weight=1)
         create_frame.grid_rowconfigure(2, weight=1)
 
-    def populate_customer_combobox(self):
-        customers = self.db.execute_query(
-            "SELECT CustomerID, CustomerName FROM Accounts",
-            fetch=True
+    def _load_order_window_data(self):
+        """Fetch everything the order window shows over a single connection"""
+        generation = self._restart_order_history()
+        # Combobox lists already cached since their last invalidation are not fetched again
+        missing = [
+            (key, query)
+            for key, query in (('customers_min', SQL_SELECT_CUSTOMERS_MIN),
+                               ('books_in_stock', SQL_SELECT_BOOKS_IN_STOCK))
+            if key not in self._cache
+        ]
+        self.run_in_background(
+            self.db.fetch_batch,
+            [(query, ()) for _, query in missing] + [
+                (SQL_SELECT_PENDING_ORDERS, (SQL_DATETIME_FORMAT,)),
+                (SQL_SELECT_ORDER_HISTORY, (SQL_DATETIME_FORMAT, _TREE_PAGE_SIZE)),
+            ],
+            callback=lambda results: self._on_order_window_loaded([key for key, _ in missing], results, generation),
+            errback=lambda: self._on_history_failed(generation)
         )
-        self.customer_combobox['values'] = [f"{cid} - {name}" for cid, name in customers]
+
+    def _on_order_window_loaded(self, keys: List[str], results, generation: int):
+        if not self.orders_tree.winfo_exists():
+            return
+        *lookups, pending, history = results
+        for key, rows in zip(keys, lookups):
+            self._cache.setdefault(key, rows)
+        self.populate_customer_combobox()
+        self.populate_book_combobox()
+        self._populate_pending_orders(pending)
+        self._populate_order_history(history, generation, reset=True)
+
+    def populate_customer_combobox(self):
+        customers = self._cached('customers_min', SQL_SELECT_CUSTOMERS_MIN)
+        # Labels map straight back to IDs, so names containing " - " never need parsing
+        self._customer_id_by_label = {f"{cid} - {name}": cid for cid, name in customers}
+        self.customer_combobox['values'] = list(self._customer_id_by_label)
 
     def populate_book_combobox(self):
-        books = self.db.execute_query(
-            "SELECT BookID, BookName FROM Books WHERE Quantity > 0",
-            fetch=True
-        )
-        self.book_combobox['values'] = [f"{bid} - {name}" for bid, name in books]
+        books = self._cached('books_in_stock', SQL_SELECT_BOOKS_IN_STOCK)
+        # Name, price and stock by ID, so adding to the cart needs no extra query
+        self._book_by_id = {b[0]: b for b in books}
+        self.book_combobox['values'] = [f"{b[0]} - {b[1]}" for b in books]
 
     def add_to_cart(self):
         """Add selected book to the cart"""
@@ -1460,36 +2010,27 @@ class BookstoreApp:
                 messagebox.showerror("Error", "Please select a book")
                 return
             
-            book_id = int(book_selection.split(" - ")[0])
+            book_id = int(book_selection.split(" - ", 1)[0])
             quantity = int(self.order_qty.get())
             
             if quantity <= 0:
                 messagebox.showerror("Error", "Quantity must be positive")
                 return
             
-            # Get book details
-            book = self.db.execute_query(
-                "SELECT BookName, Price, Quantity FROM Books WHERE BookID=%s",
-                (book_id,),
-                fetch=True
-            )
+            # Book details come from the combobox rows; stock is re-checked at checkout
+            book = self._book_by_id.get(book_id)
             
             if not book:
                 messagebox.showerror("Error", "Book not found")
                 return
             
-            book_name, price, available_qty = book[0]
+            _, book_name, price, available_qty = book
             
             if quantity > available_qty:
                 messagebox.showerror("Error", f"Only {available_qty} available in stock")
                 return
             
-            # Add to cart treeview
-            subtotal = price * quantity
-            self.cart_tree.insert('', 'end', values=(book_id, book_name, quantity, f"${price:.2f}", f"${subtotal:.2f}"))
-            
-            # Update totals
-            self.update_order_totals()
+            self._add_cart_line(book_id, book_name, quantity, Decimal(price))
             
             # Clear selection
             self.book_combobox.set('')
@@ -1500,26 +2041,30 @@ class BookstoreApp:
             logging.error(f"Error adding to cart: {e}")
             messagebox.showerror("Error", f"Failed to add to cart: {e}")
 
+    def _add_cart_line(self, book_id: int, book_name: str, quantity: int, price: Decimal):
+        """Add a line to the cart, its tree row and the running totals"""
+        # Numbers stay numeric and are only formatted for display
+        subtotal = price * quantity
+        iid = self.cart_tree.insert(
+            '', 'end', values=(book_id, book_name, quantity, f"${price:.2f}", f"${subtotal:.2f}")
+        )
+        self._cart[iid] = (book_id, quantity, price)
+        self._cart_count += quantity
+        self._cart_total += subtotal
+        self.update_order_totals()
+
     def update_order_totals(self):
         """Update the order summary totals"""
-        total_items = 0
-        total_amount = 0.0
-        
-        for item in self.cart_tree.get_children():
-            values = self.cart_tree.item(item)['values']
-            total_items += int(values[2])
-            total_amount += float(values[4][1:])  # Remove $ sign
-        
-        self.total_items_var.set(str(total_items))
-        self.total_amount_var.set(f"${total_amount:.2f}")
+        self.total_items_var.set(str(self._cart_count))
+        self.total_amount_var.set(f"${self._cart_total:.2f}")
 
     def clear_cart(self):
         """Clear all items from the cart"""
-        for item in self.cart_tree.get_children():
-            self.cart_tree.delete(item)
-        
-        self.total_items_var.set("0")
-        self.total_amount_var.set("$0.00")
+        self.cart_tree.delete(*self.cart_tree.get_children())
+        self._cart.clear()
+        self._cart_count = 0
+        self._cart_total = Decimal("0")
+        self.update_order_totals()
 
     def place_order(self, status="Completed"):
         """Place the order and save to database"""
@@ -1530,112 +2075,167 @@ class BookstoreApp:
                 messagebox.showerror("Error", "Please select a customer")
                 return
             
-            customer_id = int(customer_selection.split(" - ")[0])
+            customer_id = self._customer_id_by_label.get(customer_selection)
+            if customer_id is None:
+                messagebox.showerror("Error", "Please select a customer")
+                return
             
             # Validate cart has items
-            cart_items = self.cart_tree.get_children()
-            if not cart_items:
+            if not self._cart:
                 messagebox.showerror("Error", "Cart is empty")
                 return
             
-            # Calculate total amount
-            total_amount = sum(
-                float(self.cart_tree.item(item)['values'][4][1:])  # Remove $ sign
-                for item in cart_items
-            )
-            
-            # Start transaction
-            self.db.connection.start_transaction()
+            # Snapshot the lines once; both batches are built from it
+            lines = list(self._cart.values())
+            item_count = self._cart_count
+            total_amount = self._cart_total
             
-            # Create order record
+            # Create order record, items and stock updates in one transaction.
+            # The cart's Books rows are locked and checked first: prices and stock in the cart come
+            # from cached rows. The day's DailySales row is shared by every checkout, so its bump
+            # is the last statement and that lock is held only until commit.
             order_date = datetime.now()
-            cursor = self.db.connection.cursor()
-            
-            cursor.execute(
-                "INSERT INTO Orders (CustomerID, StaffID, OrderDate, TotalAmount, Status) "
-                "VALUES (%s, %s, %s, %s, %s)",
-                (customer_id, self.current_staff['id'], order_date, total_amount, status)
-            )
-            
-            order_id = cursor.lastrowid
-            
-            # Add order items and update book quantities (if order is completed)
-            for item in cart_items:
-                values = self.cart_tree.item(item)['values']
-                book_id = values[0]
-                quantity = values[2]
-                price = float(values[3][1:])  # Remove $ sign
-                
-                # Add order item
+            with self.db.transaction() as cursor:
+                self._check_cart_books(cursor, lines, take_stock=status == "Completed")
+
                 cursor.execute(
-                    "INSERT INTO OrderItems (OrderID, BookID, Quantity, Price) "
-                    "VALUES (%s, %s, %s, %s)",
-                    (order_id, book_id, quantity, price)
+                    SQL_INSERT_ORDER,
+                    (customer_id, self.current_staff['id'], order_date, total_amount, status)
                 )
                 
-                # Update book quantity if order is completed
-                if status == "Completed":
-                    cursor.execute(
-                        "UPDATE Books SET Quantity = Quantity - %s WHERE BookID = %s",
-                        (quantity, book_id)
-                    )
-            
-            # Commit transaction
-            self.db.connection.commit()
-            cursor.close()
+                order_id = cursor.lastrowid
+                order_items = [(order_id, book_id, quantity, price) for book_id, quantity, price in lines]
+
+                # Add all order items in a single multi-row INSERT
+                cursor.executemany(SQL_INSERT_ORDER_ITEM, order_items)
+
+                cursor.execute(SQL_BUMP_DAILY_SALES, (order_date.date(), item_count, total_amount))
             
+            if status == "Completed":
+                self._invalidate('books_in_stock')
             messagebox.showinfo("Success", f"Order #{order_id} placed successfully as {status}!")
             self.clear_cart()
-            self.load_pending_orders()
-            self.load_order_history()
+            self._schedule_refresh('orders', self.reload_orders)
             
+        except ValueError as e:
+            # The cached book rows were out of date; reload them before the cart is rebuilt
+            self._invalidate('books_in_stock')
+            self.populate_book_combobox()
+            messagebox.showerror("Error", f"Failed to place order: {e}")
         except Exception as e:
-            self.db.connection.rollback()
             logging.error(f"Error placing order: {e}")
             messagebox.showerror("Error", f"Failed to place order: {e}")
 
-    def load_pending_orders(self):
-        """Load pending orders into the treeview"""
-        for item in self.pending_orders_tree.get_children():
-            self.pending_orders_tree.delete(item)
+    def _check_cart_books(self, cursor, lines, take_stock: bool):
+        """Lock the Books rows of (book_id, quantity, price) cart lines and check them, taking stock if asked
+
+        Raises ValueError, for the caller to roll back, if a book is gone, has been repriced
+        since it was added to the cart, or (when taking stock) is short.
+        """
+        requested = {}
+        prices = {}
+        for book_id, quantity, price in lines:
+            requested[book_id] = requested.get(book_id, 0) + quantity
+            prices.setdefault(book_id, set()).add(price)
         
-        orders = self.db.execute_query(
-            "SELECT o.OrderID, a.CustomerName, o.OrderDate, o.TotalAmount, o.Status "
-            "FROM Orders o JOIN Accounts a ON o.CustomerID = a.CustomerID "
-            "WHERE o.Status = 'Pending' "
-            "ORDER BY o.OrderDate DESC",
-            fetch=True
+        # Lock every row in one pass, in BookID order so concurrent checkouts cannot deadlock
+        book_ids = sorted(requested)
+        placeholders = ", ".join(["%s"] * len(book_ids))
+        cursor.execute(
+            f"SELECT BookID, BookName, Quantity, Price FROM Books WHERE BookID IN ({placeholders}) "
+            "ORDER BY BookID FOR UPDATE",
+            book_ids
         )
-        
-        for order in orders:
-            order_id, customer, date, total, status = order
-            formatted_date = date.strftime("%Y-%m-%d %H:%M")
-            formatted_total = f"${total:.2f}"
-            self.pending_orders_tree.insert('', 'end', values=(
-                order_id, customer, formatted_date, formatted_total, status))
-        
+        books = {book_id: (name, quantity, price) for book_id, name, quantity, price in cursor.fetchall()}
+        for book_id in book_ids:
+            if book_id not in books:
+                raise ValueError(f"Book #{book_id} is no longer available")
+            name, available, price = books[book_id]
+            if prices[book_id] != {price}:
+                raise ValueError(f"The price of '{name}' is now ${price:.2f}; add it to the cart again")
+            if take_stock and requested[book_id] > available:
+                raise ValueError(f"Only {available} of '{name}' in stock")
+
+        if not take_stock:
+            return
+
+        # One UPDATE for every book while the rows are still locked
+        cases = " ".join(["WHEN %s THEN %s"] * len(book_ids))
+        cursor.execute(
+            f"UPDATE Books SET Quantity = Quantity - CASE BookID {cases} END "
+            f"WHERE BookID IN ({placeholders})",
+            [value for book_id in book_ids for value in (book_id, requested[book_id])] + book_ids
+        )
+
+    def reload_orders(self):
+        """Refresh the pending orders and the first history page over one connection"""
+        generation = self._restart_order_history()
+        self.run_in_background(
+            self.db.fetch_batch,
+            [
+                (SQL_SELECT_PENDING_ORDERS, (SQL_DATETIME_FORMAT,)),
+                (SQL_SELECT_ORDER_HISTORY, (SQL_DATETIME_FORMAT, _TREE_PAGE_SIZE)),
+            ],
+            callback=lambda results: self._on_orders_reloaded(results, generation),
+            errback=lambda: self._on_history_failed(generation)
+        )
+
+    def _restart_order_history(self) -> int:
+        """Start order history over from the first page; return the new generation"""
+        self._history_generation += 1
+        self._history_key = None
+        self._history_loading = True
+        return self._history_generation
+
+    def _on_orders_reloaded(self, results, generation: int):
+        pending, history = results
+        self._populate_pending_orders(pending)
+        self._populate_order_history(history, generation, reset=True)
+
+    def _populate_pending_orders(self, rows):
+        if not self.pending_orders_tree.winfo_exists():
+            return
+
+        # Items per order, so selecting an order needs no further queries
+        self._pending_items = {}
+        orders = []
+        for order_id, order_rows in groupby(rows, key=itemgetter(0)):
+            order_rows = list(order_rows)
+            orders.append(order_rows[0][:5])
+            self._pending_items[order_id] = [row[5:] for row in order_rows if row[5] is not None]
+
+        self._repopulate(self.pending_orders_tree, orders)
         # Clear order items tree
-        for item in self.pending_items_tree.get_children():
-            self.pending_items_tree.delete(item)
+        self._repopulate(self.pending_items_tree, ())
 
-    def load_order_history(self):
-        """Load all orders into the treeview"""
-        for item in self.orders_tree.get_children():
-            self.orders_tree.delete(item)
-        
-        orders = self.db.execute_query(
-            "SELECT o.OrderID, a.CustomerName, o.OrderDate, o.TotalAmount, o.Status "
-            "FROM Orders o JOIN Accounts a ON o.CustomerID = a.CustomerID "
-            "ORDER BY o.OrderDate DESC",
-            fetch=True
+    def _load_more_order_history(self):
+        if self._history_loading or self._history_key is None:
+            return
+        self._history_loading = True
+        # Keyset on (OrderDate, OrderID) so deep pages cost the same as the first
+        last_date, last_id = self._history_key
+        generation = self._history_generation
+        self.run_query_async(
+            SQL_SELECT_ORDER_HISTORY_AFTER,
+            (SQL_DATETIME_FORMAT, last_date, last_date, last_id, _TREE_PAGE_SIZE),
+            callback=lambda orders: self._populate_order_history(orders, generation),
+            errback=lambda: self._on_history_failed(generation)
         )
-        
-        for order in orders:
-            order_id, customer, date, total, status = order
-            formatted_date = date.strftime("%Y-%m-%d %H:%M")
-            formatted_total = f"${total:.2f}"
-            self.orders_tree.insert('', 'end', values=(
-                order_id, customer, formatted_date, formatted_total, status))
+
+    def _on_history_failed(self, generation: int):
+        # Let the next scroll to the bottom retry instead of leaving paging stuck,
+        # unless a newer load has taken over since
+        if generation == self._history_generation:
+            self._history_loading = False
+
+    def _populate_order_history(self, orders, generation: int, reset: bool = False):
+        # A page requested before the history restarted belongs after rows that are gone
+        if generation != self._history_generation or not self.orders_tree.winfo_exists():
+            return
+        self._history_loading = False
+        # A short page means there is nothing older left to fetch
+        self._history_key = (orders[-1][5], orders[-1][0]) if len(orders) == _TREE_PAGE_SIZE else None
+        self._repopulate(self.orders_tree, [order[:5] for order in orders], clear=reset)
 
     def update_order_status(self, new_status):
         """Update the status of a pending order"""
@@ -1652,40 +2252,28 @@ class BookstoreApp:
             return
         
         try:
-            # Start transaction
-            self.db.connection.start_transaction()
-            cursor = self.db.connection.cursor()
-            
-            if new_status == "Completed":
-                # Get all order items to update book quantities
-                items = self.db.execute_query(
-                    "SELECT BookID, Quantity FROM OrderItems WHERE OrderID=%s",
-                    (order_id,),
-                    fetch=True
-                )
+            with self.db.transaction() as cursor:
+                # The tree may be stale; the stored order decides
+                cursor.execute(SQL_LOCK_ORDER, (order_id,))
+                order = cursor.fetchone()
+                if order is None or order[0] != "Pending":
+                    raise ValueError(f"Order #{order_id} is no longer pending")
                 
-                for book_id, quantity in items:
-                    cursor.execute(
-                        "UPDATE Books SET Quantity = Quantity - %s WHERE BookID = %s",
-                        (quantity, book_id)
-                    )
-            
-            # Update order status
-            cursor.execute(
-                "UPDATE Orders SET Status=%s WHERE OrderID=%s",
-                (new_status, order_id)
-            )
-            
-            # Commit transaction
-            self.db.connection.commit()
-            cursor.close()
+                if new_status == "Completed":
+                    # One joined UPDATE for every item; each book must cover its quantity
+                    cursor.execute(SQL_TAKE_ORDER_STOCK, (order_id,))
+                    if cursor.rowcount < order[1]:
+                        raise ValueError(f"Not enough stock to complete order #{order_id}")
+                
+                # Update order status
+                cursor.execute(SQL_UPDATE_ORDER_STATUS, (new_status, order_id))
             
+            if new_status == "Completed":
+                self._invalidate('books_in_stock')
             messagebox.showinfo("Success", f"Order #{order_id} updated to {new_status}")
-            self.load_pending_orders()
-            self.load_order_history()
+            self._schedule_refresh('orders', self.reload_orders)
             
         except Exception as e:
-            self.db.connection.rollback()
             logging.error(f"Error updating order status: {e}")
             messagebox.showerror("Error", f"Failed to update order: {e}")
 
@@ -1697,23 +2285,8 @@ class BookstoreApp:
         
         order_id = self.pending_orders_tree.item(selected[0])['values'][0]
         
-        # Clear existing items
-        for item in self.pending_items_tree.get_children():
-            self.pending_items_tree.delete(item)
-        
-        # Load order items
-        items = self.db.execute_query(
-            "SELECT oi.BookID, b.BookName, oi.Quantity, oi.Price, (oi.Quantity * oi.Price) "
-            "FROM OrderItems oi JOIN Books b ON oi.BookID = b.BookID "
-            "WHERE oi.OrderID=%s",
-            (order_id,),
-            fetch=True
-        )
-        
-        for item in items:
-            book_id, book_name, quantity, price, subtotal = item
-            self.pending_items_tree.insert('', 'end', values=(
-                book_id, book_name, quantity, f"${price:.2f}", f"${subtotal:.2f}"))
+        # Items were fetched, already formatted, together with the pending orders
+        self._repopulate(self.pending_items_tree, self._pending_items.get(order_id, []))
 
     def show_reports(self):
         """Show reports window"""
@@ -1786,70 +2359,39 @@ class BookstoreApp:
 
     def generate_sales_report(self):
         """Generate sales report for selected date range"""
-        try:
-            from_date = self.from_date.get().strip()
-            to_date = self.to_date.get().strip()
-            
-            if not from_date or not to_date:
-                messagebox.showerror("Error", "Please select both start and end dates")
-                return
-            
-            # Clear existing data
-            for item in self.sales_tree.get_children():
-                self.sales_tree.delete(item)
-            
-            # Get daily sales data
-            sales_data = self.db.execute_query(
-                "SELECT DATE(o.OrderDate) AS SaleDate, "
-                "COUNT(DISTINCT o.OrderID) AS Orders, "
-                "SUM(oi.Quantity) AS ItemsSold, "
-                "SUM(TotalAmount) AS TotalSales "
-                "FROM Orders o "
-                "JOIN OrderItems oi ON o.OrderID = oi.OrderID "
-                "WHERE DATE(OrderDate) BETWEEN %s AND %s "
-                "GROUP BY DATE(OrderDate) "
-                "ORDER BY SaleDate",
-                (from_date, to_date),
-                fetch=True
-            )
-            
-            total_sales = Decimal("0")
-            
-            for row in sales_data:
-                sale_date, orders, items_sold, sales = row
-                formatted_date = sale_date.strftime("%Y-%m-%d")
-                formatted_sales = f"${sales:.2f}"
-                self.sales_tree.insert('', 'end', values=(
-                    formatted_date, orders, items_sold, formatted_sales))
-                total_sales += sales
-            
-            messagebox.showinfo("Success", f"Report generated for {from_date} to {to_date}\nTotal Sales: ${total_sales:.2f}")
+        from_date = self.from_date.get().strip()
+        to_date = self.to_date.get().strip()
         
-        except Exception as e:
-            logging.error(f"Error generating sales report: {e}")
-            messagebox.showerror("Error", f"Failed to generate report: {e}")
+        if not from_date or not to_date:
+            messagebox.showerror("Error", "Please select both start and end dates")
+            return
+        
+        self.run_query_async(
+            SQL_SELECT_SALES_REPORT,
+            (SQL_DATE_FORMAT, from_date, to_date),
+            callback=lambda sales_data: self._populate_sales_report(sales_data, from_date, to_date)
+        )
+
+    def _populate_sales_report(self, sales_data, from_date: str, to_date: str):
+        if not self.sales_tree.winfo_exists():
+            return
+        # Rows arrive formatted; ISO date strings sort chronologically
+        days = sorted(row for row in sales_data if row[0] is not None)
+        total_sales = next((row[3] for row in sales_data if row[0] is None), "$0.00")
+        self._repopulate(self.sales_tree, days)
+        
+        messagebox.showinfo("Success", f"Report generated for {from_date} to {to_date}\nTotal Sales: {total_sales}")
 
     def load_inventory_report(self):
         """Load inventory report data"""
-        try:
-            for item in self.inventory_tree.get_children():
-                self.inventory_tree.delete(item)
-            
-            inventory = self.db.execute_query(
-                "SELECT BookID, BookName, Genre, Quantity, Price FROM Books "
-                "ORDER BY Genre, BookName",
-                fetch=True
-            )
-            
-            for book in inventory:
-                book_id, name, genre, quantity, price = book
-                formatted_price = f"${price:.2f}"
-                self.inventory_tree.insert('', 'end', values=(
-                    book_id, name, genre, quantity, formatted_price))
-        
-        except Exception as e:
-            logging.error(f"Error loading inventory report: {e}")
-            messagebox.showerror("Error", f"Failed to load inventory: {e}")
+        # The whole catalogue is listed, so rows are shown batch by batch as they stream in
+        self.inventory_tree.delete(*self.inventory_tree.get_children())
+        self.stream_query_async(SQL_SELECT_INVENTORY, on_rows=self._append_inventory_rows)
+
+    def _append_inventory_rows(self, rows):
+        if not self.inventory_tree.winfo_exists():
+            return
+        self._repopulate(self.inventory_tree, rows, clear=False)
 
     def show_settings(self):
         """Show settings window"""
@@ -1858,6 +2400,7 @@ class BookstoreApp:
     def on_closing(self):
         """Handle application closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
+            self.executor.shutdown(wait=False)
             self.db.close()
             self.root.destroy()
 